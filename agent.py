@@ -4,16 +4,35 @@ Smithery MCP 서버와 로컬 커스텀 툴을 통합하는 에이전트를 관
 """
 
 import os
+import re
+import sys
+import csv
+import io
+import json
 import asyncio
+import inspect
+import functools
 import logging
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import AsyncExitStack
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass
+from itertools import islice
+from typing import IO, Deque, Dict, Any, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+from dataclasses import dataclass, fields
 
+import anyio
 import structlog
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# HTTP 전송 계층 (설치된 mcp 버전에 없으면 MCP 연결을 건너뜀)
+try:
+    from mcp.client.streamable_http import streamablehttp_client
+except ImportError:
+    streamablehttp_client = None
+
 # 환경변수 로드
 try:
     from dotenv import load_dotenv
@@ -22,19 +41,247 @@ except ImportError:
     # python-dotenv가 설치되지 않은 경우 무시
     pass
 
+# 결과 직렬화 크기 계산 (orjson이 없으면 기본 방식 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 로컬 툴 임포트
 from tools import current_date, add, subtract, multiply, divide
 
+# 공유 HTTP 클라이언트
+from http_client import close_http_client, mcp_http_client_factory
+
+# Smithery 인증 정보 (환경변수에서 한 번만 읽음)
+from config import smithery_credentials
+
+
+# 툴 실행 실패 시 예외 타입별 사용자 응답
+_TOOL_ERROR_RESPONSES: Dict[str, str] = {
+    'ZeroDivisionError': "계산 오류: 0으로 나눌 수 없습니다.",
+    'TypeError': "입력 오류: 올바른 숫자를 입력해주세요.",
+    'TimeoutError': "처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+}
+
+# 메시지 처리 중 발생한 예외 클래스별 사용자 친화적 메시지
+_ERROR_MESSAGES: Dict[type, str] = {
+    ConnectionError: "네트워크 연결에 문제가 있습니다. 잠시 후 다시 시도해주세요.",
+    TimeoutError: "요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+    asyncio.TimeoutError: "요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+    MemoryError: "메모리 부족으로 요청을 처리할 수 없습니다. 더 간단한 요청을 시도해주세요.",
+    PermissionError: "권한 문제로 요청을 처리할 수 없습니다.",
+}
+
+
+# 간단한 툴 선택용 연산 패턴 ("15 + 25", "15 더하기 25" 등)
+# 모든 연산자를 하나의 패턴으로 묶어 메시지를 한 번만 스캔합니다.
+# 두 번째 피연산자는 전방 탐색으로 잡아 "1 + 2 - 3"처럼 연산자가 다른 이어진 식도 감지하고,
+# 같은 연산자 표현끼리 겹치는 매치("1 + 2 + 3", "2024-10-15")는 _OP_SCAN 기준으로 건너뜁니다.
+_OP_RE = re.compile(r'(\d+)\s*(\+|-|[*×]|[/÷]|더하기|빼기|곱하기|나누기)\s*(?=(\d+))')
+
+# 연산자 -> (툴 이름, 연산명, 표시 기호)
+_OP_MAP: Dict[str, Tuple[str, str, str]] = {
+    '+': ('add', '덧셈', '+'),
+    '더하기': ('add', '덧셈', '+'),
+    '-': ('subtract', '뺄셈', '-'),
+    '빼기': ('subtract', '뺄셈', '-'),
+    '*': ('multiply', '곱셈', '×'),
+    '×': ('multiply', '곱셈', '×'),
+    '곱하기': ('multiply', '곱셈', '×'),
+    '/': ('divide', '나눗셈', '÷'),
+    '÷': ('divide', '나눗셈', '÷'),
+    '나누기': ('divide', '나눗셈', '÷'),
+}
+
+# 연산자 -> 겹침 판정 그룹 (연산자 표현별로 따로 스캔하던 방식과 같은 매치만 남기기 위한 키)
+_OP_SCAN: Dict[str, str] = {
+    '+': '+',
+    '더하기': '더하기',
+    '-': '-',
+    '빼기': '빼기',
+    '*': '*',
+    '×': '*',
+    '곱하기': '곱하기',
+    '/': '/',
+    '÷': '/',
+    '나누기': '나누기',
+}
+
+# 수학 연산 툴 이름 -> 응답에 표시할 기호
+_OP_SYMBOLS: Dict[str, str] = {
+    'add': '+',
+    'subtract': '-',
+    'multiply': '×',
+    'divide': '÷',
+}
+_MATH_OPS = frozenset(_OP_SYMBOLS)
+
+
+# 결과 통합 포맷터: (결과, 번호) -> 응답 한 줄 (번호가 0이면 단일 결과 응답)
+def _fmt_date(r: Dict[str, Any], i: int) -> str:
+    return f"{i}. 현재 날짜: {r['result']}" if i else f"오늘 날짜는 {r['result']}입니다."
+
+
+def _fmt_math(r: Dict[str, Any], i: int) -> str:
+    p = r['parameters']
+    prefix = f"{i}. " if i else ""
+    return f"{prefix}{p['a']} {_OP_SYMBOLS[r['tool_name']]} {p['b']} = {r['result']}"
+
+
+def _fmt_generic(r: Dict[str, Any], i: int) -> str:
+    return f"{i}. {r['tool_name']}: {r['result']}" if i else f"{r['tool_name']} 결과: {r['result']}"
+
+
+_FORMATTERS = {
+    'current_date': _fmt_date,
+    **{op: _fmt_math for op in _MATH_OPS},
+}
+
+# 툴 선택 키워드 (키워드 목록을 하나의 패턴으로 묶어 한 번의 스캔으로 감지)
+_DATE_RE = re.compile(r'날짜|오늘|현재|date|today')
+_NOTION_RE = re.compile(r'notion|노션|메모|문서|페이지|노트')
+
+# 툴 선택 사전 검사: 숫자도 키워드도 없는 메시지는 패턴 매칭을 건너뜀
+_HAS_DIGIT_RE = re.compile(r'\d')
+_TRIGGER_RE = re.compile(f'{_DATE_RE.pattern}|{_NOTION_RE.pattern}')
+
+# 수학 연산 추출용 패턴 (기호/자연어 표현을 하나의 패턴으로 한 번에 스캔)
+# - "A + B", "A 더하기 B" 형태: 그룹 2(연산자), 그룹 3(B, 전방 탐색으로 이어진 식도 감지,
+#   같은 연산자 표현끼리 겹치는 매치는 _OP_SCAN 기준으로 건너뜀)
+# - "A을 B로 나눠줘", "A를 B로 나누면" 형태: 그룹 4(B)
+_NUM = r'(\d+(?:\.\d+)?)'
+_MATH_OP_RE = re.compile(
+    _NUM + r'\s*(?:(\+|-|[*×]|[/÷]|더하기|빼기|곱하기|나누기)\s*(?=' + _NUM + r')'
+    r'|을?\s*' + _NUM + r'\s*으?로\s*나[누눠])'
+)
+
+# 연산자 -> (툴 이름, 선택 이유)
+_MATH_OP_INFO: Dict[str, Tuple[str, str]] = {
+    '+': ('add', '덧셈 패턴 감지'),
+    '-': ('subtract', '뺄셈 패턴 감지'),
+    '*': ('multiply', '곱셈 패턴 감지'),
+    '×': ('multiply', '곱셈 패턴 감지'),
+    '/': ('divide', '나눗셈 패턴 감지'),
+    '÷': ('divide', '나눗셈 패턴 감지'),
+    '더하기': ('add', '자연어 덧셈 감지'),
+    '빼기': ('subtract', '자연어 뺄셈 감지'),
+    '곱하기': ('multiply', '자연어 곱셈 감지'),
+    '나누기': ('divide', '자연어 나눗셈 감지'),
+}
+
+@functools.lru_cache(maxsize=1024)
+def _route(message_lower: str) -> Tuple[Tuple[str, Tuple[Tuple[str, Any], ...], str], ...]:
+    """
+    정규화된 메시지에서 패턴 매칭으로 툴 선택
+    
+    같은 메시지가 반복되면 캐시된 결과를 재사용하므로, 호출 측이 수정할 수 없도록
+    (툴 이름, 매개변수 항목들, 선택 이유) 튜플로 반환합니다.
+    
+    Args:
+        message_lower: 소문자화/공백 제거된 사용자 메시지
+        
+    Returns:
+        Tuple: 선택된 툴들의 (이름, 매개변수 항목, 이유) 튜플
+    """
+    routes = []
+    
+    # 날짜 관련
+    if _DATE_RE.search(message_lower) is not None:
+        routes.append(('current_date', (), '날짜 관련 키워드 감지'))
+    
+    # 수학 연산 - 간단한 패턴 (미리 컴파일된 정규식 사용)
+    # 같은 연산자 표현의 매치는 이전 매치의 두 번째 피연산자 이후부터만 인정
+    scan_end: Dict[str, int] = {}
+    for m in _OP_RE.finditer(message_lower):
+        a, op, b = m.group(1, 2, 3)
+        scan = _OP_SCAN[op]
+        if m.start() < scan_end.get(scan, 0):
+            continue
+        scan_end[scan] = m.end(3)
+        name, label, symbol = _OP_MAP[op]
+        routes.append((name, (('a', int(a)), ('b', int(b))), f'{label} 패턴 감지: {a} {symbol} {b}'))
+    
+    return tuple(routes)
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_logging_once() -> None:
+    """로깅 시스템 설정 (전역 상태이므로 프로세스당 한 번만 수행)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
+    # structlog 설정
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.processors.UnicodeDecoder(),
+            structlog.processors.JSONRenderer()
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
 
 @dataclass
 class ToolExecutionLog:
-    """툴 실행 로그를 위한 데이터 클래스"""
+    """
+    툴 실행 로그를 위한 데이터 클래스
+    
+    로그가 링 버퍼에 대량으로 쌓이므로 __slots__로 인스턴스별 __dict__를 없앱니다.
+    (dataclass(slots=True)는 Python 3.10+ 전용이라 직접 선언하며, 슬롯과 클래스 속성
+    기본값은 함께 쓸 수 없어 모든 필드를 필수 인자로 둡니다)
+    """
+    __slots__ = ('tool_name', 'tool_type', 'parameters', 'execution_time', 'result',
+                 'timestamp', 'is_error', 'error_type')
+    
     tool_name: str
     tool_type: str  # "mcp" 또는 "local"
     parameters: Dict[str, Any]
     execution_time: float
     result: Any
     timestamp: datetime
+    is_error: bool  # 결과가 "ERROR:"로 시작하는 실패 로그 여부
+    error_type: Optional[str]  # 실패 로그의 에러 요약 ("ERROR:" 뒤 첫 항목)
+    
+    @property
+    def success(self) -> bool:
+        """툴 실행 성공 여부"""
+        return not self.is_error
+    
+    @property
+    def error(self) -> Optional[str]:
+        """실패 로그의 에러 메시지 (성공 시 None)"""
+        return self.result if self.is_error else None
+
+
+def _approx_log_bytes() -> int:
+    """일반적인 툴 실행 로그 한 건의 대략적인 메모리 크기 (바이트)"""
+    sample = ToolExecutionLog(
+        tool_name="add",
+        tool_type="local",
+        parameters={"a": 15, "b": 25},
+        execution_time=0.001,
+        result=40,
+        timestamp=datetime.now(),
+        is_error=False,
+        error_type=None
+    )
+    return sys.getsizeof(sample) + sum(sys.getsizeof(getattr(sample, f.name)) for f in fields(sample))
+
+
+# 상태 모니터링에서 로그 메모리 사용량 추정에 사용하는 로그 한 건당 크기
+_APPROX_LOG_BYTES = _approx_log_bytes()
 
 
 class StrandsAgentManager:
@@ -42,29 +289,64 @@ class StrandsAgentManager:
     Strands Agent를 관리하고 MCP 서버 및 로컬 툴과의 통합을 처리하는 클래스
     """
     
-    def __init__(self):
+    # 재연결로 복구를 시도할 MCP 에러 타입
+    _RETRYABLE_ERRORS = (ConnectionError, asyncio.TimeoutError)
+    
+    # 자원 해제 단계별 최대 대기 시간 (초)
+    _CLOSE_TIMEOUT = 5.0
+    
+    # 에러 폭주 감지: _FAILURE_WINDOW초 안에 _FAILURE_THRESHOLD회 이상 실패하면 즉시 폴백 응답
+    _FAILURE_WINDOW = 60.0
+    _FAILURE_THRESHOLD = 10
+    
+    def __init__(self, max_concurrent_tools: int = 8):
         """
         StrandsAgentManager 초기화
         - 로깅 설정
         - MCP 클라이언트 초기화
         - 로컬 툴 등록
+        
+        Args:
+            max_concurrent_tools: 한 번에 동시 실행할 수 있는 최대 툴 수
         """
-        # 로깅 설정
+        # 로깅 설정 (프로세스당 한 번만 수행)
+        _configure_logging_once()
         self.logger = structlog.get_logger(__name__)
-        self._setup_logging()
+        # 핫 패스에서 비활성화된 INFO 로그의 페이로드 구성을 건너뛰기 위한 플래그
+        self._info_enabled = self.logger.isEnabledFor(logging.INFO)
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         
         # MCP 관련 속성
         self.mcp_client: Optional[ClientSession] = None
         self.mcp_connected: bool = False
         self.mcp_connection_error: Optional[str] = None
         self.mcp_last_error_time: Optional[datetime] = None
+        self.mcp_tools: Dict[str, Dict[str, Any]] = {}
+        
+        # MCP 세션 풀 - 연결을 매니저 수명 동안 유지하여 핸드셰이크 비용을 재사용
+        # (전송/세션 컨텍스트는 anyio 취소 범위를 쓰므로 진입한 소유 태스크에서만 닫음)
+        self._mcp_owner: Optional[Tuple[asyncio.Task, asyncio.Event]] = None
+        self._mcp_session_key: Optional[Tuple[str, str, str]] = None
+        self._smithery_url: Optional[str] = None
+        self._smithery_profile: Optional[str] = None
         
         # 로컬 툴 등록
         self.local_tools: Dict[str, callable] = {}
         self._register_local_tools()
         
-        # 실행 로그
-        self.execution_logs: List[ToolExecutionLog] = []
+        # 실행 로그 (최근 log_capacity개만 보관하는 링 버퍼, 최소 1개)
+        # 크기 0이면 추가 즉시 버려져 통계의 증분 차감이 맞지 않으므로 1 미만은 1로 보정
+        self.log_capacity = max(1, int(os.getenv('STRANDS_LOG_RING', '1024')))
+        self.execution_logs: Deque[ToolExecutionLog] = deque(maxlen=self.log_capacity)
+        
+        # 지금까지 기록된 로그 수 (링 버퍼 크기와 무관하게 계속 증가하는 커서)
+        self._log_seq = 0
+        
+        # 툴 사용 통계 (로그 추가/제거 시점에 증분 갱신)
+        self._reset_stats()
+        
+        # 툴 동시 실행 제한 (MCP 서버 과부하 방지)
+        self.max_concurrent_tools = max_concurrent_tools
         
         # 에러 처리 설정
         self.max_consecutive_errors = 5
@@ -72,33 +354,10 @@ class StrandsAgentManager:
         self.circuit_breaker_open = False
         self.circuit_breaker_reset_time: Optional[datetime] = None
         
-        self.logger.info("StrandsAgentManager 초기화 완료")
-    
-    def _setup_logging(self) -> None:
-        """로깅 시스템 설정"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # 최근 메시지 처리 실패 시각 (time.monotonic 기준)
+        self._recent_failures: Deque[float] = deque(maxlen=20)
         
-        # structlog 설정
-        structlog.configure(
-            processors=[
-                structlog.stdlib.filter_by_level,
-                structlog.stdlib.add_logger_name,
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.TimeStamper(fmt="iso"),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                structlog.processors.UnicodeDecoder(),
-                structlog.processors.JSONRenderer()
-            ],
-            context_class=dict,
-            logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
-            cache_logger_on_first_use=True,
-        )
+        self.logger.info("StrandsAgentManager 초기화 완료")
     
     def _register_local_tools(self) -> None:
         """로컬 커스텀 툴들을 등록 (Strands Agent 스타일)"""
@@ -106,7 +365,19 @@ class StrandsAgentManager:
         
         # 데코레이터로 등록된 툴들 가져오기
         all_tools = get_all_tools()
-        self.local_tools = {name: info['function'] for name, info in all_tools.items()}
+        self.local_tools = {name: spec.function for name, spec in all_tools.items()}
+        self._local_tool_names: frozenset = frozenset(self.local_tools)
+        
+        # 매개변수 검증용 시그니처 (inspect.signature는 비용이 크므로 등록 시 한 번만 계산)
+        self._tool_signatures: Dict[str, inspect.Signature] = {
+            name: inspect.signature(func) for name, func in self.local_tools.items()
+        }
+        
+        # 툴 정보는 등록 이후 변하지 않으므로 미리 계산해 둠 (툴 등록 시점에만 갱신)
+        self._local_tool_info_by_name: Dict[str, Dict[str, Any]] = {
+            name: self._build_local_tool_info(name) for name in self.local_tools
+        }
+        self._local_tools_info_cache: List[Dict[str, Any]] = list(self._local_tool_info_by_name.values())
         
         self.logger.info(
             "로컬 툴 등록 완료",
@@ -133,60 +404,84 @@ class StrandsAgentManager:
         API 키를 통한 인증 및 연결 실패 시 재시도 로직 포함
         향상된 에러 처리 및 graceful degradation 지원
         """
-        # Smithery 설정 (직접 입력)
-        api_key = os.getenv('SMITHERY_API_KEY', '20f09ddc-b65d-448c-9c3b-4199c5cc7892')
-        profile = os.getenv('SMITHERY_PROFILE', 'profitable-cicada-SuKab9')
-        
-        if not api_key or not profile:
-            self.logger.warning("Smithery API 키 또는 프로필이 설정되지 않음 - MCP 서버 연결 건너뜀")
-            self.mcp_connection_error = "Smithery API 키 또는 프로필이 설정되지 않았습니다"
+        if streamablehttp_client is None:
+            self.logger.warning("MCP HTTP 클라이언트를 사용할 수 없음 - MCP 서버 연결 건너뜀")
+            self.mcp_connection_error = "설치된 mcp 패키지가 HTTP 전송을 지원하지 않습니다"
             return
         
+        base_url = "https://server.smithery.ai/@smithery/notion/mcp"
+        
+        # Smithery 접속 URL은 최초 한 번만 구성하고 재연결 시 재사용
+        if self._smithery_url is None:
+            api_key, profile = smithery_credentials()
+            
+            if not api_key or not profile:
+                self.logger.warning("Smithery API 키 또는 프로필이 설정되지 않음 - MCP 서버 연결 건너뜀")
+                self.mcp_connection_error = "Smithery API 키 또는 프로필이 설정되지 않았습니다"
+                return
+            
+            params = {"api_key": api_key, "profile": profile}
+            self._smithery_url = f"{base_url}?{urlencode(params)}"
+            self._smithery_profile = profile
+        
+        url = self._smithery_url
+        
         max_retries = 3
         retry_delay = 2  # 초
         connection_timeout = 30  # 연결 타임아웃
         
+        # 세션 풀 키: (URL, 사용자 식별자, 전송 방식)
+        session_key = (base_url, self._smithery_profile, "streamable_http")
+        
+        # 동일한 키로 이미 열린 세션이 있으면 재사용
+        if self.mcp_client is not None and self._mcp_session_key == session_key:
+            self.logger.info("기존 MCP 세션 재사용", server=base_url)
+            self.mcp_connected = True
+            return
+        
         for attempt in range(max_retries):
             try:
                 self.logger.info(f"MCP 서버 연결 시도 {attempt + 1}/{max_retries}")
+                self.logger.info(f"Smithery MCP 서버 연결 중: {base_url}")
                 
-                # Smithery HTTP MCP 서버 연결 설정
-                from mcp.client.streamable_http import streamablehttp_client
-                from urllib.parse import urlencode
+                # 연결 소유 태스크가 연결을 열고 종료 신호가 올 때까지 유지
+                # (실패 시 소유 태스크가 자원을 정리한 뒤 ready로 예외를 전달하고 종료)
+                ready: asyncio.Future = asyncio.get_running_loop().create_future()
+                shutdown = asyncio.Event()
+                owner_task = asyncio.ensure_future(
+                    self._run_mcp_session(url, connection_timeout, ready, shutdown)
+                )
+                try:
+                    session, tools = await ready
+                except asyncio.CancelledError:
+                    owner_task.cancel()
+                    raise
+                except Exception:
+                    await owner_task
+                    raise
+                
+                # MCP 툴 목록 캐시
+                self.mcp_tools = {
+                    tool.name: {
+                        'name': tool.name,
+                        'description': tool.description,
+                        'schema': tool.inputSchema
+                    }
+                    for tool in tools
+                }
                 
-                base_url = "https://server.smithery.ai/@smithery/notion/mcp"
-                params = {"api_key": api_key, "profile": profile}
-                url = f"{base_url}?{urlencode(params)}"
+                # 이전 세션 정리 후 새 세션 등록
+                await self._close_mcp_session()
+                self._mcp_owner = (owner_task, shutdown)
+                self._mcp_session_key = session_key
+                self.mcp_client = session
                 
-                self.logger.info(f"Smithery MCP 서버 연결 중: {base_url}")
+                self.mcp_connected = True
+                self.mcp_connection_error = None
+                
+                self.logger.info(f"Smithery MCP 서버 연결 성공 - {len(tools)}개 툴 사용 가능")
+                return
                 
-                # HTTP 클라이언트로 연결 시도 (타임아웃 설정)
-                async with streamablehttp_client(url) as (read, write, _):
-                    async with ClientSession(read, write) as session:
-                        # 연결 테스트
-                        await asyncio.wait_for(
-                            self._test_mcp_connection(session), 
-                            timeout=connection_timeout
-                        )
-                        
-                        # 툴 목록 가져와서 저장
-                        tools_result = await session.list_tools()
-                        tools = tools_result.tools if hasattr(tools_result, 'tools') else []
-                        
-                        # MCP 툴 등록
-                        for tool in tools:
-                            self.mcp_tools[tool.name] = {
-                                'name': tool.name,
-                                'description': tool.description,
-                                'schema': tool.inputSchema
-                            }
-                        
-                        self.mcp_connected = True
-                        self.mcp_connection_error = None
-                        
-                        self.logger.info(f"Smithery MCP 서버 연결 성공 - {len(tools)}개 툴 사용 가능")
-                        return
-                        
             except asyncio.TimeoutError:
                 error_msg = f"MCP 서버 연결 타임아웃 ({connection_timeout}초)"
                 self.logger.warning(f"{error_msg} (시도 {attempt + 1}/{max_retries})")
@@ -226,12 +521,15 @@ class StrandsAgentManager:
         if not hasattr(self, 'mcp_connection_error') or not self.mcp_connection_error:
             self.mcp_connection_error = "모든 연결 시도가 실패했습니다"
     
-    async def _test_mcp_connection(self, session: ClientSession) -> None:
+    async def _test_mcp_connection(self, session: ClientSession) -> List[Any]:
         """
         MCP 연결 테스트
         
         Args:
             session: MCP 클라이언트 세션
+            
+        Returns:
+            List[Any]: 서버가 제공하는 툴 목록
         """
         try:
             # 서버 정보 요청으로 연결 테스트
@@ -242,11 +540,140 @@ class StrandsAgentManager:
             tools_result = await session.list_tools()
             tools = tools_result.tools if hasattr(tools_result, 'tools') else []
             self.logger.info("MCP 툴 목록 수신", tool_count=len(tools))
+            return tools
             
         except Exception as e:
             self.logger.error("MCP 연결 테스트 실패", error=str(e))
             raise
     
+    async def _run_mcp_session(self, url: str, connection_timeout: float,
+                               ready: asyncio.Future, shutdown: asyncio.Event) -> None:
+        """
+        MCP 연결 소유 태스크
+        
+        streamablehttp_client와 ClientSession은 anyio 태스크 그룹을 사용하므로 진입한 태스크에서
+        종료해야 합니다. 이 태스크가 연결을 열어 (세션, 툴 목록)을 ready로 전달하고,
+        shutdown 신호를 받으면 같은 태스크에서 연결을 닫습니다.
+        
+        Args:
+            url: Smithery MCP 접속 URL
+            connection_timeout: 연결 테스트 타임아웃 (초)
+            ready: 연결 결과 또는 예외를 전달할 Future
+            shutdown: 연결 종료 신호
+        """
+        try:
+            # 공유 HTTP 클라이언트로 연결 (종료 시 스택이 연결 자원을 정리)
+            async with AsyncExitStack() as stack:
+                read, write, _ = await stack.enter_async_context(
+                    streamablehttp_client(url, httpx_client_factory=mcp_http_client_factory)
+                )
+                session = await stack.enter_async_context(ClientSession(read, write))
+                
+                # 연결 테스트 (initialize는 한 번만 수행)
+                tools = await asyncio.wait_for(
+                    self._test_mcp_connection(session),
+                    timeout=connection_timeout
+                )
+                
+                ready.set_result((session, tools))
+                await shutdown.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                # 연결 성공 후 정리 중 발생한 에러는 로깅만 수행
+                self.logger.warning("MCP 연결 자원 정리 중 오류", error=str(e))
+    
+    async def _close_mcp_session(self) -> None:
+        """현재 풀에 보관된 MCP 세션을 닫음 (소유 태스크에 종료 신호를 보내고 정리를 기다림)"""
+        owner = self._mcp_owner
+        self._mcp_owner = None
+        self._mcp_session_key = None
+        self.mcp_client = None
+        if owner is None:
+            return
+        
+        owner_task, shutdown = owner
+        shutdown.set()
+        try:
+            # 소유 태스크의 종료만 기다림 (정리 중 에러는 소유 태스크가 로깅)
+            await asyncio.wait((owner_task,))
+        except asyncio.CancelledError:
+            # 기다리던 쪽이 취소(타임아웃 등)되면 소유 태스크도 취소해 정리를 끝냄
+            owner_task.cancel()
+            raise
+    
+    async def aclose(self) -> None:
+        """
+        매니저가 보유한 MCP 세션과 공유 HTTP 클라이언트 등 연결 자원 해제
+        
+        각 정리 단계는 최대 _CLOSE_TIMEOUT초까지만 대기하며, 시간이 초과되면
+        대기가 취소되면서 MCP 연결 소유 태스크도 함께 취소됩니다.
+        """
+        with anyio.move_on_after(self._CLOSE_TIMEOUT) as scope:
+            await self._close_mcp_session()
+        if scope.cancelled_caught:
+            self.logger.warning("MCP 세션 정리 타임아웃", timeout=self._CLOSE_TIMEOUT)
+        
+        with anyio.move_on_after(self._CLOSE_TIMEOUT) as scope:
+            await close_http_client()
+        if scope.cancelled_caught:
+            self.logger.warning("HTTP 클라이언트 정리 타임아웃", timeout=self._CLOSE_TIMEOUT)
+        
+        self.mcp_connected = False
+        self.logger.info("StrandsAgentManager 자원 해제 완료")
+    
+    async def __aenter__(self) -> "StrandsAgentManager":
+        """async with 진입 시 에이전트 초기화"""
+        await self.initialize()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """async with 종료 시 연결 자원 해제"""
+        await self.aclose()
+    
+    def _reset_stats(self) -> None:
+        """툴 사용 통계 초기화"""
+        self._stats: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"count": 0, "total_time": 0.0, "successes": 0, "errors": 0, "tool_type": ""}
+        )
+        self._error_summary: Counter = Counter()
+        self._total_time = 0.0
+        self._successful_executions = 0
+    
+    def _update_stats(self, log: ToolExecutionLog, delta: int) -> None:
+        """
+        로그 한 건을 툴 사용 통계에 반영
+        
+        Args:
+            log: 반영할 실행 로그
+            delta: 1이면 추가, -1이면 제거 (링 버퍼에서 밀려난 로그)
+        """
+        tool_stats = self._stats[log.tool_name]
+        if not tool_stats["tool_type"]:
+            tool_stats["tool_type"] = log.tool_type
+        
+        tool_stats["count"] += delta
+        tool_stats["total_time"] += delta * log.execution_time
+        self._total_time += delta * log.execution_time
+        
+        # 성공/실패 카운트
+        if log.is_error:
+            tool_stats["errors"] += delta
+            self._error_summary[log.error_type] += delta
+            if self._error_summary[log.error_type] <= 0:
+                del self._error_summary[log.error_type]
+        else:
+            tool_stats["successes"] += delta
+            self._successful_executions += delta
+        
+        if tool_stats["count"] <= 0:
+            del self._stats[log.tool_name]
+    
     def _log_tool_execution(self, tool_name: str, tool_type: str, 
                            parameters: Dict[str, Any], execution_time: float, 
                            result: Any, success: bool = True, error: str = None,
@@ -264,52 +691,87 @@ class StrandsAgentManager:
             error: 에러 메시지 (실패 시)
             selection_reason: 툴 선택 이유
         """
+        # 실패 여부와 에러 요약은 기록 시점에 한 번만 판별
+        is_error = isinstance(result, str) and result.startswith("ERROR:")
         log_entry = ToolExecutionLog(
             tool_name=tool_name,
             tool_type=tool_type,
             parameters=parameters,
             execution_time=execution_time,
             result=result,
-            timestamp=datetime.now()
+            timestamp=datetime.now(),
+            is_error=is_error,
+            error_type=result.split(":")[1].strip() if is_error else None
         )
         
+        # 링 버퍼가 가득 차면 밀려날 가장 오래된 로그를 통계에서 제외
+        if len(self.execution_logs) == self.execution_logs.maxlen:
+            self._update_stats(self.execution_logs[0], -1)
         self.execution_logs.append(log_entry)
+        self._log_seq += 1
+        self._update_stats(log_entry, 1)
+        
+        # 결과 크기는 한 번만 계산하여 재사용
+        result_size = self._estimate_result_size(result)
+        
+        # 성능/결과 크기 모니터링 (1초 이상, 10KB 이상)
+        slow = execution_time > 1.0
+        oversize = result_size > 10000
+        
+        # 실행 결과와 모니터링 정보를 하나의 이벤트로 기록
+        # (INFO 비활성화 시 정상 성공 로그의 페이로드 구성을 생략)
+        if not success or slow or oversize or self._info_enabled:
+            log_data = {
+                "tool_name": tool_name,
+                "tool_type": tool_type,
+                "execution_time": execution_time,
+                "parameters": parameters,
+                "success": success,
+                "result_type": type(result).__name__,
+                "result_size": result_size,
+                "selection_reason": selection_reason,
+                "slow": slow,
+                "oversize": oversize
+            }
+            
+            if error:
+                log_data["error"] = error
+                log_data["error_type"] = type(error).__name__ if isinstance(error, Exception) else "string"
+            
+            if not success:
+                self.logger.error("툴 실행 실패", **log_data)
+            elif slow or oversize:
+                self.logger.warning("툴 실행 성공 (임계값 초과)", **log_data)
+            else:
+                self.logger.info("툴 실행 성공", **log_data)
+    
+    @staticmethod
+    def _estimate_result_size(result: Any) -> int:
+        """
+        툴 결과 크기 추정 (전체 문자열 변환 없이)
         
-        # 상세 로깅
-        log_data = {
-            "tool_name": tool_name,
-            "tool_type": tool_type,
-            "execution_time": execution_time,
-            "parameters": parameters,
-            "success": success,
-            "result_type": type(result).__name__,
-            "result_size": len(str(result)) if result is not None else 0,
-            "selection_reason": selection_reason
-        }
-        
-        if error:
-            log_data["error"] = error
-            log_data["error_type"] = type(error).__name__ if isinstance(error, Exception) else "string"
+        문자열/바이트는 길이, 리스트/딕셔너리는 orjson 직렬화 크기(바이트)를 사용하고
+        orjson이 없거나 직렬화할 수 없으면 항목 수로 대신합니다.
+        그 외 타입만 repr 길이로 계산합니다.
         
-        if success:
-            self.logger.info("툴 실행 성공", **log_data)
-        else:
-            self.logger.error("툴 실행 실패", **log_data)
-        
-        # 성능 모니터링 로깅
-        if execution_time > 1.0:  # 1초 이상 걸린 경우
-            self.logger.warning("툴 실행 시간 초과", 
-                              tool_name=tool_name,
-                              execution_time=execution_time,
-                              threshold=1.0)
-        
-        # 결과 크기 모니터링
-        result_size = len(str(result)) if result is not None else 0
-        if result_size > 10000:  # 10KB 이상인 경우
-            self.logger.warning("툴 결과 크기 초과",
-                              tool_name=tool_name,
-                              result_size=result_size,
-                              threshold=10000)
+        Args:
+            result: 툴 실행 결과
+            
+        Returns:
+            int: 추정 크기
+        """
+        if result is None:
+            return 0
+        if isinstance(result, (str, bytes)):
+            return len(result)
+        if isinstance(result, (list, dict)):
+            if orjson is not None:
+                try:
+                    return len(orjson.dumps(result, default=str))
+                except TypeError:
+                    pass
+            return len(result)
+        return len(repr(result))
     
     async def process_message(self, message: str) -> str:
         """
@@ -323,6 +785,13 @@ class StrandsAgentManager:
         """
         self.logger.info("메시지 처리 시작", message=message)
         
+        # 에러 폭주 중에는 툴 선택/실행 없이 바로 폴백 응답 (재시도 루프로 인한 비용 증가 방지)
+        if self._in_failure_storm():
+            self.logger.warning("에러 폭주 감지, 폴백 응답 반환",
+                              window=self._FAILURE_WINDOW,
+                              threshold=self._FAILURE_THRESHOLD)
+            return self._generate_fallback_response(message)
+        
         try:
             # 입력 검증
             if not message or not message.strip():
@@ -346,8 +815,16 @@ class StrandsAgentManager:
             # 선택된 툴들 실행 (에러 처리 포함)
             results = await self._execute_selected_tools_safely(selected_tools)
             
+            # 성공/실패 개수를 한 번의 순회로 집계
+            successful_count = failed_count = 0
+            for r in results:
+                if r['success']:
+                    successful_count += 1
+                else:
+                    failed_count += 1
+            
             # 모든 툴이 실패한 경우 처리
-            if not any(r['success'] for r in results):
+            if not successful_count:
                 self.logger.warning("모든 툴 실행 실패", message=message)
                 return self._generate_error_response(results)
             
@@ -355,12 +832,12 @@ class StrandsAgentManager:
             response = await self._integrate_tool_results(message, selected_tools, results)
             
             # 결과 통합 과정 로깅
-            self.log_result_integration_process(results, response)
+            self.log_result_integration_process(results, response, successful_count, failed_count)
             
             self.logger.info("메시지 처리 완료", 
                            tools_used=len(selected_tools),
-                           successful_tools=len([r for r in results if r['success']]),
-                           failed_tools=len([r for r in results if not r['success']]),
+                           successful_tools=successful_count,
+                           failed_tools=failed_count,
                            response_length=len(response))
             
             return response
@@ -368,11 +845,13 @@ class StrandsAgentManager:
         except asyncio.TimeoutError:
             error_msg = "요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
             self.logger.error("메시지 처리 타임아웃", message=message)
+            self._recent_failures.append(time.monotonic())
             return error_msg
             
         except MemoryError:
             error_msg = "메모리 부족으로 요청을 처리할 수 없습니다. 더 간단한 요청을 시도해주세요."
             self.logger.error("메모리 부족 에러", message=message)
+            self._recent_failures.append(time.monotonic())
             return error_msg
             
         except Exception as e:
@@ -381,8 +860,23 @@ class StrandsAgentManager:
                             error=str(e), 
                             error_type=type(e).__name__,
                             message=message)
+            self._recent_failures.append(time.monotonic())
             return error_msg
     
+    def _in_failure_storm(self) -> bool:
+        """
+        최근 _FAILURE_WINDOW초 안의 메시지 처리 실패가 임계값 이상인지 확인
+        
+        Returns:
+            bool: 에러 폭주 상태 여부
+        """
+        if len(self._recent_failures) < self._FAILURE_THRESHOLD:
+            return False
+        
+        cutoff = time.monotonic() - self._FAILURE_WINDOW
+        recent = sum(1 for t in self._recent_failures if t > cutoff)
+        return recent >= self._FAILURE_THRESHOLD
+    
     def _generate_fallback_response(self, message: str) -> str:
         """
         툴을 찾지 못했을 때의 대체 응답 생성
@@ -414,19 +908,12 @@ class StrandsAgentManager:
         Returns:
             str: 에러 응답
         """
-        error_types = set()
         for result in results:
-            if 'error' in result:
-                error_types.add(type(result.get('error', '')).__name__)
-        
-        if 'ZeroDivisionError' in error_types:
-            return "계산 오류: 0으로 나눌 수 없습니다."
-        elif 'TypeError' in error_types:
-            return "입력 오류: 올바른 숫자를 입력해주세요."
-        elif 'TimeoutError' in error_types:
-            return "처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
-        else:
-            return "요청 처리 중 오류가 발생했습니다. 다른 방식으로 시도해보세요."
+            message = _TOOL_ERROR_RESPONSES.get(result.get('error_type'))
+            if message:
+                return message
+        
+        return "요청 처리 중 오류가 발생했습니다. 다른 방식으로 시도해보세요."
     
     def _generate_graceful_error_message(self, error: Exception) -> str:
         """
@@ -438,44 +925,65 @@ class StrandsAgentManager:
         Returns:
             str: 사용자 친화적 에러 메시지
         """
-        error_type = type(error).__name__
+        # 예외 클래스 계층을 따라 가장 가까운 메시지 선택 (하위 클래스도 처리)
+        for cls in type(error).__mro__:
+            message = _ERROR_MESSAGES.get(cls)
+            if message:
+                return message
         
-        if error_type == 'ConnectionError':
-            return "네트워크 연결에 문제가 있습니다. 잠시 후 다시 시도해주세요."
-        elif error_type == 'TimeoutError':
-            return "요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."
-        elif error_type == 'MemoryError':
-            return "메모리 부족으로 요청을 처리할 수 없습니다. 더 간단한 요청을 시도해주세요."
-        elif error_type == 'PermissionError':
-            return "권한 문제로 요청을 처리할 수 없습니다."
-        elif 'JSON' in error_type or 'Parse' in error_type:
+        error_type = type(error).__name__
+        if 'JSON' in error_type or 'Parse' in error_type:
             return "데이터 처리 중 오류가 발생했습니다. 다시 시도해주세요."
-        else:
-            return f"일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+        
+        return "일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
     
-    async def _execute_selected_tools_safely(self, selected_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _execute_selected_tools_safely(self, selected_tools: List[Dict[str, Any]],
+                                             max_concurrent: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        선택된 툴들을 안전하게 실행 (향상된 에러 처리)
+        선택된 툴들을 안전하게 동시 실행 (향상된 에러 처리)
+        
+        각 툴은 독립적으로 실행되며, 결과는 입력 순서대로 반환됩니다.
+        동시 실행 수는 max_concurrent (기본값: max_concurrent_tools)로 제한됩니다.
         
         Args:
             selected_tools: 실행할 툴들의 정보
+            max_concurrent: 최대 동시 실행 수
             
         Returns:
             List[Dict[str, Any]]: 실행 결과들
         """
-        results = []
+        # 요청마다 세마포어를 생성하여 이벤트 루프가 바뀌어도 안전하게 사용
+        semaphore = asyncio.Semaphore(max_concurrent or self.max_concurrent_tools)
+        
+        results = await asyncio.gather(
+            *[self._run_one(tool_info, semaphore) for tool_info in selected_tools]
+        )
+        return list(results)
+    
+    async def _run_one(self, tool_info: Dict[str, Any],
+                       semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        단일 툴 실행 (예외를 발생시키지 않고 결과 딕셔너리로 반환)
         
-        for tool_info in selected_tools:
-            tool_name = tool_info['name']
-            tool_type = tool_info['type']
-            parameters = tool_info['parameters']
-            reason = tool_info['reason']
+        Args:
+            tool_info: 실행할 툴 정보
+            semaphore: 동시 실행 수를 제한하는 세마포어
             
+        Returns:
+            Dict[str, Any]: 실행 결과
+        """
+        tool_name = tool_info['name']
+        tool_type = tool_info['type']
+        parameters = tool_info['parameters']
+        reason = tool_info['reason']
+        
+        async with semaphore:
             try:
-                self.logger.info(f"툴 실행 시작: {tool_name}", 
-                               tool_type=tool_type,
-                               parameters=parameters,
-                               reason=reason)
+                if self._info_enabled:
+                    self.logger.info(f"툴 실행 시작: {tool_name}", 
+                                   tool_type=tool_type,
+                                   parameters=parameters,
+                                   reason=reason)
                 
                 # 툴 타입별 실행
                 if tool_type == 'local':
@@ -494,28 +1002,29 @@ class StrandsAgentManager:
                 else:
                     raise ValueError(f"알 수 없는 툴 타입: {tool_type}")
                 
-                results.append({
+                return {
                     'tool_name': tool_name,
                     'tool_type': tool_type,
                     'parameters': parameters,
                     'result': result,
                     'success': True,
                     'reason': reason
-                })
+                }
                 
             except asyncio.TimeoutError:
                 error_msg = f"툴 실행 시간 초과: {tool_name}"
                 self.logger.error(error_msg, tool_name=tool_name, timeout=10.0)
                 
-                results.append({
+                return {
                     'tool_name': tool_name,
                     'tool_type': tool_type,
                     'parameters': parameters,
                     'result': error_msg,
                     'success': False,
                     'reason': reason,
-                    'error': 'TimeoutError'
-                })
+                    'error': 'TimeoutError',
+                    'error_type': 'TimeoutError'
+                }
                 
             except Exception as e:
                 error_msg = f"툴 실행 실패: {str(e)}"
@@ -525,21 +1034,124 @@ class StrandsAgentManager:
                                 tool_type=tool_type,
                                 parameters=parameters)
                 
-                results.append({
+                return {
                     'tool_name': tool_name,
                     'tool_type': tool_type,
                     'parameters': parameters,
                     'result': error_msg,
                     'success': False,
                     'reason': reason,
-                    'error': str(e)
+                    'error': str(e),
+                    'error_type': type(e).__name__
+                }
+    
+    async def batch_execute(self, operations: List[Dict[str, Any]], max_concurrent: Optional[int] = None,
+                            stop_on_error: bool = False) -> List[Dict[str, Any]]:
+        """
+        여러 툴 호출을 메시지 분석 없이 한 번에 동시 실행
+        
+        같은 배치 안에서 툴 이름과 인자가 동일한 호출은 한 번만 실행하고 결과를 공유합니다.
+        
+        Args:
+            operations: [{"tool": 툴 이름, "arguments": 매개변수}, ...] 형태의 호출 목록
+            max_concurrent: 최대 동시 실행 수 (기본값: max_concurrent_tools)
+            stop_on_error: True면 첫 실패 시 남은 호출을 취소
+            
+        Returns:
+            List[Dict[str, Any]]: operations 순서대로 정렬된 호출별 실행 결과
+        """
+        if max_concurrent is None:
+            max_concurrent = self.max_concurrent_tools
+        
+        selected_tools: List[Dict[str, Any]] = []
+        op_indexes: List[int] = []
+        seen: Dict[Any, int] = {}
+        
+        for operation in operations:
+            tool_name = operation['tool']
+            arguments = operation.get('arguments') or {}
+            
+            # 배치 내 중복 호출 제거 (해시할 수 없는 인자는 중복 제거 대상에서 제외)
+            # 1, 1.0, True는 서로 같은 값으로 해시되므로 값의 타입도 키에 포함
+            try:
+                key = (tool_name, frozenset((k, type(v), v) for k, v in arguments.items()))
+                hash(key)
+            except TypeError:
+                key = None
+            
+            if key is not None and key in seen:
+                op_indexes.append(seen[key])
+                continue
+            
+            if key is not None:
+                seen[key] = len(selected_tools)
+            op_indexes.append(len(selected_tools))
+            selected_tools.append({
+                'name': tool_name,
+                'type': 'local' if tool_name in self.local_tools else 'mcp',
+                'parameters': dict(arguments),
+                'reason': '배치 실행 요청'
+            })
+        
+        self.logger.info("배치 실행 시작",
+                        operation_count=len(operations),
+                        unique_count=len(selected_tools),
+                        max_concurrent=max_concurrent,
+                        stop_on_error=stop_on_error)
+        
+        if stop_on_error:
+            unique_results = await self._execute_until_first_error(selected_tools, max_concurrent)
+        else:
+            unique_results = await self._execute_selected_tools_safely(selected_tools, max_concurrent)
+        
+        return [dict(unique_results[index]) for index in op_indexes]
+    
+    async def _execute_until_first_error(self, selected_tools: List[Dict[str, Any]],
+                                         max_concurrent: int) -> List[Dict[str, Any]]:
+        """
+        툴들을 동시 실행하되 하나라도 실패하면 남은 툴 실행을 취소
+        
+        Args:
+            selected_tools: 실행할 툴들의 정보
+            max_concurrent: 최대 동시 실행 수
+            
+        Returns:
+            List[Dict[str, Any]]: 입력 순서대로 정렬된 실행 결과들 (취소된 툴은 실패로 기록)
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        tasks = [asyncio.create_task(self._run_one(tool_info, semaphore)) for tool_info in selected_tools]
+        
+        # _run_one은 예외를 발생시키지 않으므로 완료된 결과의 success 값으로 실패를 감지
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(not task.result()['success'] for task in done):
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                break
+        
+        results = []
+        for task, tool_info in zip(tasks, selected_tools):
+            if task.cancelled():
+                results.append({
+                    'tool_name': tool_info['name'],
+                    'tool_type': tool_info['type'],
+                    'parameters': tool_info['parameters'],
+                    'result': "이전 툴 실행 실패로 취소되었습니다",
+                    'success': False,
+                    'reason': tool_info['reason'],
+                    'error': 'cancelled',
+                    'error_type': 'CancelledError'
                 })
+            else:
+                results.append(task.result())
         
         return results
     
     async def _execute_mcp_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Any:
         """
-        MCP 툴 실행 (향후 구현)
+        MCP 툴 실행 (풀에 보관된 세션 재사용)
         
         Args:
             tool_name: MCP 툴 이름
@@ -548,8 +1160,10 @@ class StrandsAgentManager:
         Returns:
             Any: 툴 실행 결과
         """
-        # TODO: 실제 MCP 툴 실행 로직 구현
-        raise NotImplementedError("MCP 툴 실행은 향후 구현 예정")
+        if self.mcp_client is None:
+            raise ConnectionError("MCP 세션이 열려있지 않습니다")
+        
+        return await self.mcp_client.call_tool(tool_name, parameters)
     
     def get_available_tools(self) -> Dict[str, Any]:
         """사용 가능한 툴 목록 반환"""
@@ -560,20 +1174,45 @@ class StrandsAgentManager:
                 "details": self.get_all_local_tools_info()
             },
             "mcp_tools": {
-                "count": 0,
-                "tools": [],  # TODO: MCP 연결 후 업데이트
+                "count": len(self.mcp_tools),
+                "tools": list(self.mcp_tools.keys()),
                 "connected": self.mcp_connected
             },
-            "total_tools": len(self.local_tools)
+            "total_tools": len(self.local_tools) + len(self.mcp_tools)
         }
     
     def get_execution_logs(self) -> List[ToolExecutionLog]:
         """실행 로그 반환"""
-        return self.execution_logs.copy()
+        return list(self.execution_logs)
+    
+    def log_cursor(self) -> int:
+        """
+        현재 로그 위치 반환 (get_logs_since에 전달하여 이후 기록된 로그만 조회)
+        
+        Returns:
+            int: 지금까지 기록된 로그 수
+        """
+        return self._log_seq
+    
+    def get_logs_since(self, cursor: int) -> List[ToolExecutionLog]:
+        """
+        log_cursor() 이후에 기록된 실행 로그 반환
+        
+        Args:
+            cursor: log_cursor()로 얻은 로그 위치
+            
+        Returns:
+            List[ToolExecutionLog]: 기록 순서대로 정렬된 새 로그 (링 버퍼에 남아 있는 것만)
+        """
+        new_count = min(self._log_seq - cursor, len(self.execution_logs))
+        if new_count <= 0:
+            return []
+        return list(islice(self.execution_logs, len(self.execution_logs) - new_count, None))
     
     def clear_logs(self) -> None:
         """실행 로그 초기화"""
         self.execution_logs.clear()
+        self._reset_stats()
         self.logger.info("실행 로그 초기화 완료")
     
     async def reconnect_mcp(self) -> bool:
@@ -585,7 +1224,7 @@ class StrandsAgentManager:
         """
         self.logger.info("MCP 서버 재연결 시도")
         self.mcp_connected = False
-        self.mcp_client = None
+        await self._close_mcp_session()
         
         try:
             await self._setup_mcp_connection()
@@ -607,11 +1246,13 @@ class StrandsAgentManager:
         """
         self.logger.error("MCP 에러 발생", error=str(error), error_type=type(error).__name__)
         
-        # 에러 카운트 증가
+        # 에러 카운트 증가 및 MCP 연결 상태 업데이트
         self.consecutive_error_count += 1
         self.mcp_last_error_time = datetime.now()
+        self.mcp_connected = False
+        self.mcp_connection_error = str(error)
         
-        # Circuit Breaker 패턴 적용
+        # Circuit Breaker 패턴 적용 - 열리면 재연결을 시도하지 않고 바로 종료
         if self.consecutive_error_count >= self.max_consecutive_errors:
             self.circuit_breaker_open = True
             self.circuit_breaker_reset_time = datetime.now()
@@ -619,17 +1260,14 @@ class StrandsAgentManager:
                 "MCP Circuit Breaker 활성화 - 일시적으로 MCP 사용 중단",
                 consecutive_errors=self.consecutive_error_count
             )
+            return
         
-        # 연결 관련 에러인 경우 재연결 시도 (Circuit Breaker가 열리지 않은 경우만)
-        if not self.circuit_breaker_open and isinstance(error, (ConnectionError, asyncio.TimeoutError)):
+        # 연결 관련 에러인 경우 재연결 시도
+        if isinstance(error, self._RETRYABLE_ERRORS):
             self.logger.info("연결 에러로 인한 MCP 재연결 시도")
             success = await self.reconnect_mcp()
             if success:
                 self.consecutive_error_count = 0  # 성공 시 에러 카운트 리셋
-        
-        # MCP 연결 상태 업데이트
-        self.mcp_connected = False
-        self.mcp_connection_error = str(error)
     
     def reset_circuit_breaker(self) -> bool:
         """
@@ -670,6 +1308,39 @@ class StrandsAgentManager:
             "circuit_breaker_reset_time": self.circuit_breaker_reset_time
         }
     
+    async def snapshot(self, cursor: int) -> Dict[str, Any]:
+        """
+        요청 처리 직후 UI에 필요한 상태를 한 번에 수집
+        
+        process_message와 같은 백그라운드 태스크에서 이어서 호출하면
+        UI 스레드가 상태 조회마다 매니저를 따로 호출할 필요가 없습니다.
+        
+        Args:
+            cursor: 요청 전에 log_cursor()로 얻은 로그 위치
+            
+        Returns:
+            Dict[str, Any]: MCP 상태(mcp_status)와 이번 요청의 실행 로그(new_logs)
+        """
+        return {
+            "mcp_status": self.get_mcp_status(),
+            "new_logs": self.get_logs_since(cursor)
+        }
+    
+    async def process_message_with_snapshot(self, message: str,
+                                            cursor: int) -> Tuple[str, Dict[str, Any]]:
+        """
+        메시지를 처리하고 처리 직후의 상태 스냅샷을 함께 반환
+        
+        Args:
+            message: 사용자 입력 메시지
+            cursor: 요청 전에 log_cursor()로 얻은 로그 위치
+            
+        Returns:
+            Tuple[str, Dict[str, Any]]: (응답 메시지, snapshot() 결과)
+        """
+        response = await self.process_message(message)
+        return response, await self.snapshot(cursor)
+    
     async def safe_mcp_operation(self, operation_func, *args, **kwargs) -> Any:
         """
         MCP 작업을 안전하게 실행하는 래퍼 함수
@@ -721,12 +1392,13 @@ class StrandsAgentManager:
         if tool_name not in self.local_tools:
             raise ValueError(f"존재하지 않는 로컬 툴: {tool_name}")
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            self.logger.info(f"로컬 툴 실행 시작: {tool_name}", 
-                           parameters=kwargs,
-                           selection_reason=selection_reason)
+            if self._info_enabled:
+                self.logger.info(f"로컬 툴 실행 시작: {tool_name}", 
+                               parameters=kwargs,
+                               selection_reason=selection_reason)
             
             # 매개변수 검증 로깅
             if not self.validate_tool_parameters(tool_name, kwargs):
@@ -737,7 +1409,7 @@ class StrandsAgentManager:
             result = tool_function(**kwargs)
             
             # 실행 시간 계산
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             # 향상된 로그 기록
             self._log_tool_execution(
@@ -753,7 +1425,7 @@ class StrandsAgentManager:
             return result
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             # 상세 에러 로깅
             self.logger.error(
@@ -789,9 +1461,10 @@ class StrandsAgentManager:
         Returns:
             Dict[str, Any]: 툴 정보 (이름, 설명, 매개변수 등)
         """
-        if tool_name not in self.local_tools:
-            return {}
-        
+        return self._local_tool_info_by_name.get(tool_name, {})
+    
+    def _build_local_tool_info(self, tool_name: str) -> Dict[str, Any]:
+        """로컬 툴 함수에서 툴 정보 생성"""
         tool_function = self.local_tools[tool_name]
         
         return {
@@ -802,44 +1475,8 @@ class StrandsAgentManager:
         }
     
     def get_all_local_tools_info(self) -> List[Dict[str, Any]]:
-        """모든 로컬 툴 정보 반환"""
-        return [self.get_local_tool_info(tool_name) for tool_name in self.local_tools.keys()]
-    
-    def log_tool_selection_reasoning(self, message: str, selected_tools: List[Dict[str, Any]]) -> None:
-        """
-        툴 선택 과정 로깅
-        
-        Args:
-            message: 원본 메시지
-            selected_tools: 선택된 툴들
-        """
-        self.logger.info("툴 선택 과정",
-                        message=message,
-                        selected_tools_count=len(selected_tools),
-                        selected_tools=[{
-                            'name': tool['name'],
-                            'type': tool['type'],
-                            'reason': tool['reason']
-                        } for tool in selected_tools])
-    
-    def log_result_integration_process(self, results: List[Dict[str, Any]], final_response: str) -> None:
-        """
-        결과 통합 과정 로깅
-        
-        Args:
-            results: 툴 실행 결과들
-            final_response: 최종 통합 응답
-        """
-        successful_results = [r for r in results if r['success']]
-        failed_results = [r for r in results if not r['success']]
-        
-        self.logger.info("결과 통합 과정",
-                        total_results=len(results),
-                        successful_results=len(successful_results),
-                        failed_results=len(failed_results),
-                        final_response_length=len(final_response),
-                        successful_tools=[r['tool_name'] for r in successful_results],
-                        failed_tools=[r['tool_name'] for r in failed_results])
+        """모든 로컬 툴 정보 반환 (등록 시 미리 계산된 목록)"""
+        return self._local_tools_info_cache
     
     async def call_tool_by_name(self, tool_name: str, tool_type: str = "auto", **kwargs) -> Any:
         """
@@ -856,8 +1493,7 @@ class StrandsAgentManager:
         if tool_type == "local" or (tool_type == "auto" and tool_name in self.local_tools):
             return await self.execute_local_tool(tool_name, **kwargs)
         elif tool_type == "mcp" or tool_type == "auto":
-            # TODO: MCP 툴 실행 로직 (향후 구현)
-            raise NotImplementedError("MCP 툴 실행은 향후 구현 예정")
+            return await self._execute_mcp_tool(tool_name, kwargs)
         else:
             raise ValueError(f"알 수 없는 툴 타입: {tool_type}")
     
@@ -871,21 +1507,27 @@ class StrandsAgentManager:
             
         Returns:
             bool: 검증 성공 여부
+            
+        Raises:
+            KeyError: 등록되지 않은 툴 이름
         """
-        if tool_name not in self.local_tools:
-            return False
+        signature_params = self._tool_signatures[tool_name].parameters
         
-        try:
-            # 간단한 매개변수 검증 (실제 호출 없이)
-            tool_function = self.local_tools[tool_name]
-            
-            # 함수 시그니처 검사는 향후 개선 가능
-            # 현재는 기본적인 검증만 수행
-            return True
-            
-        except Exception as e:
-            self.logger.warning(f"툴 매개변수 검증 실패: {tool_name}", error=str(e))
+        # 시그니처에 없는 매개변수 (**kwargs를 받는 툴은 이름 검사 생략)
+        accepts_any = any(param.kind is inspect.Parameter.VAR_KEYWORD
+                          for param in signature_params.values())
+        if not accepts_any and not all(name in signature_params for name in parameters):
             return False
+        
+        # 기본값이 없는 필수 매개변수 누락 여부
+        for name, param in signature_params.items():
+            if (param.default is inspect.Parameter.empty
+                    and param.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                       inspect.Parameter.KEYWORD_ONLY)
+                    and name not in parameters):
+                return False
+        
+        return True
     
     async def _analyze_message_and_select_tools(self, message: str) -> List[Dict[str, Any]]:
         """
@@ -899,8 +1541,16 @@ class StrandsAgentManager:
         """
         self.logger.info("메시지 분석 시작", message=message)
         
+        # 메시지 정규화는 한 번만 수행하여 이후 단계에서 재사용
+        message_lower = message.lower().strip()
+        
+        # 숫자나 트리거 키워드가 없으면 선택할 툴이 없으므로 바로 반환
+        if not _HAS_DIGIT_RE.search(message_lower) and not _TRIGGER_RE.search(message_lower):
+            self.logger.info("툴 선택 완료", selected_count=0, tools=[])
+            return []
+        
         # 간단한 패턴 매칭으로 툴 선택
-        selected_tools = self._simple_tool_selection(message)
+        selected_tools = self._simple_tool_selection(message_lower)
         
         # 툴 정보에 타입 추가
         for tool in selected_tools:
@@ -908,9 +1558,7 @@ class StrandsAgentManager:
         
         # MCP 툴 추가 (Notion 관련)
         if self.mcp_connected:
-            message_lower = message.lower()
-            mcp_keywords = ['notion', '노션', '메모', '문서', '페이지', '노트']
-            if any(keyword in message_lower for keyword in mcp_keywords):
+            if _NOTION_RE.search(message_lower) is not None:
                 selected_tools.append({
                     'name': 'search',  # 실제 Smithery Notion MCP 툴명
                     'type': 'mcp',
@@ -925,67 +1573,17 @@ class StrandsAgentManager:
         
         return selected_tools
     
-    def _simple_tool_selection(self, message: str) -> List[Dict[str, Any]]:
-        """간단한 패턴 매칭으로 툴 선택"""
-        message_lower = message.lower().strip()
-        selected_tools = []
-        
-        # 날짜 관련
-        if any(word in message_lower for word in ['날짜', '오늘', '현재', 'date', 'today']):
-            selected_tools.append({
-                'name': 'current_date',
-                'parameters': {},
-                'reason': '날짜 관련 키워드 감지'
-            })
-        
-        # 수학 연산 - 간단한 패턴
-        import re
-        
-        # 덧셈: "15 + 25", "15 더하기 25"
-        add_patterns = [r'(\d+)\s*\+\s*(\d+)', r'(\d+)\s*더하기\s*(\d+)']
-        for pattern in add_patterns:
-            matches = re.findall(pattern, message_lower)
-            for match in matches:
-                selected_tools.append({
-                    'name': 'add',
-                    'parameters': {'a': int(match[0]), 'b': int(match[1])},
-                    'reason': f'덧셈 패턴 감지: {match[0]} + {match[1]}'
-                })
-        
-        # 뺄셈: "50 - 30", "50 빼기 30"
-        sub_patterns = [r'(\d+)\s*-\s*(\d+)', r'(\d+)\s*빼기\s*(\d+)']
-        for pattern in sub_patterns:
-            matches = re.findall(pattern, message_lower)
-            for match in matches:
-                selected_tools.append({
-                    'name': 'subtract',
-                    'parameters': {'a': int(match[0]), 'b': int(match[1])},
-                    'reason': f'뺄셈 패턴 감지: {match[0]} - {match[1]}'
-                })
-        
-        # 곱셈: "7 * 8", "7 곱하기 8"
-        mul_patterns = [r'(\d+)\s*[*×]\s*(\d+)', r'(\d+)\s*곱하기\s*(\d+)']
-        for pattern in mul_patterns:
-            matches = re.findall(pattern, message_lower)
-            for match in matches:
-                selected_tools.append({
-                    'name': 'multiply',
-                    'parameters': {'a': int(match[0]), 'b': int(match[1])},
-                    'reason': f'곱셈 패턴 감지: {match[0]} × {match[1]}'
-                })
-        
-        # 나눗셈: "100 / 4", "100 나누기 4"
-        div_patterns = [r'(\d+)\s*[/÷]\s*(\d+)', r'(\d+)\s*나누기\s*(\d+)']
-        for pattern in div_patterns:
-            matches = re.findall(pattern, message_lower)
-            for match in matches:
-                selected_tools.append({
-                    'name': 'divide',
-                    'parameters': {'a': int(match[0]), 'b': int(match[1])},
-                    'reason': f'나눗셈 패턴 감지: {match[0]} ÷ {match[1]}'
-                })
+    def _simple_tool_selection(self, message_lower: str) -> List[Dict[str, Any]]:
+        """
+        간단한 패턴 매칭으로 툴 선택 (결과는 _route에서 메시지 단위로 캐시)
         
-        return selected_tools
+        Args:
+            message_lower: 소문자화/공백 제거된 사용자 메시지
+        """
+        return [
+            {'name': name, 'parameters': dict(params), 'reason': reason}
+            for name, params, reason in _route(message_lower)
+        ]
     
     def _extract_math_operations(self, message: str) -> List[Dict[str, Any]]:
         """
@@ -997,137 +1595,54 @@ class StrandsAgentManager:
         Returns:
             List[Dict[str, Any]]: 추출된 수학 연산들
         """
-        import re
         operations = []
         
-        # 기본 수학 연산 패턴들
-        patterns = [
-            # "A + B" 형태
-            (r'(\d+(?:\.\d+)?)\s*\+\s*(\d+(?:\.\d+)?)', 'add', '덧셈 패턴 감지'),
-            # "A - B" 형태  
-            (r'(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)', 'subtract', '뺄셈 패턴 감지'),
-            # "A * B" 또는 "A × B" 형태
-            (r'(\d+(?:\.\d+)?)\s*[*×]\s*(\d+(?:\.\d+)?)', 'multiply', '곱셈 패턴 감지'),
-            # "A / B" 또는 "A ÷ B" 형태
-            (r'(\d+(?:\.\d+)?)\s*[/÷]\s*(\d+(?:\.\d+)?)', 'divide', '나눗셈 패턴 감지'),
-        ]
-        
-        for pattern, operation, reason in patterns:
-            matches = re.findall(pattern, message)
-            for match in matches:
-                try:
-                    a = float(match[0])
-                    b = float(match[1])
-                    
-                    # 정수로 변환 가능하면 정수로 변환
-                    if a.is_integer():
-                        a = int(a)
-                    if b.is_integer():
-                        b = int(b)
-                    
-                    operations.append({
-                        'name': operation,
-                        'type': 'local',
-                        'parameters': {'a': a, 'b': b},
-                        'reason': reason
-                    })
-                except ValueError:
-                    continue
-        
-        # 자연어 수학 표현 처리
-        natural_patterns = [
-            (r'(\d+(?:\.\d+)?)\s*더하기\s*(\d+(?:\.\d+)?)', 'add', '자연어 덧셈 감지'),
-            (r'(\d+(?:\.\d+)?)\s*빼기\s*(\d+(?:\.\d+)?)', 'subtract', '자연어 뺄셈 감지'),
-            (r'(\d+(?:\.\d+)?)\s*곱하기\s*(\d+(?:\.\d+)?)', 'multiply', '자연어 곱셈 감지'),
-            (r'(\d+(?:\.\d+)?)\s*나누기\s*(\d+(?:\.\d+)?)', 'divide', '자연어 나눗셈 감지'),
-            # 추가 한국어 패턴들
-            (r'(\d+(?:\.\d+)?)\s*을?\s*(\d+(?:\.\d+)?)\s*으?로\s*나눠?줘?', 'divide', '자연어 나눗셈 감지'),
-            (r'(\d+(?:\.\d+)?)\s*을?\s*(\d+(?:\.\d+)?)\s*으?로\s*나누', 'divide', '자연어 나눗셈 감지'),
-            (r'(\d+(?:\.\d+)?)\s*나누기\s*(\d+(?:\.\d+)?)', 'divide', '자연어 나눗셈 감지'),
-        ]
-        
-        for pattern, operation, reason in natural_patterns:
-            matches = re.findall(pattern, message)
-            for match in matches:
-                try:
-                    a = float(match[0])
-                    b = float(match[1])
-                    
-                    if a.is_integer():
-                        a = int(a)
-                    if b.is_integer():
-                        b = int(b)
-                    
-                    operations.append({
-                        'name': operation,
-                        'type': 'local',
-                        'parameters': {'a': a, 'b': b},
-                        'reason': reason
-                    })
-                except ValueError:
+        # 같은 연산자 표현의 매치는 이전 매치의 두 번째 피연산자 이후부터만 인정
+        scan_end: Dict[str, int] = {}
+        for m in _MATH_OP_RE.finditer(message):
+            a_text, op, b_text, divisor_text = m.groups()
+            if op is not None:
+                scan = _OP_SCAN[op]
+                if m.start() < scan_end.get(scan, 0):
                     continue
+                scan_end[scan] = m.end(3)
+                operation, reason = _MATH_OP_INFO[op]
+            else:
+                # "A을 B로 나눠줘" 형태
+                operation, reason, b_text = 'divide', '자연어 나눗셈 감지', divisor_text
+            
+            try:
+                a = float(a_text)
+                b = float(b_text)
+                
+                # 정수로 변환 가능하면 정수로 변환
+                if a.is_integer():
+                    a = int(a)
+                if b.is_integer():
+                    b = int(b)
+                
+                operations.append({
+                    'name': operation,
+                    'type': 'local',
+                    'parameters': {'a': a, 'b': b},
+                    'reason': reason
+                })
+            except ValueError:
+                continue
         
         return operations
     
     async def _execute_selected_tools(self, selected_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        선택된 툴들을 실행
+        선택된 툴들을 동시에 실행 (_execute_selected_tools_safely에 위임)
         
         Args:
             selected_tools: 실행할 툴들의 정보
             
         Returns:
-            List[Dict[str, Any]]: 실행 결과들
+            List[Dict[str, Any]]: 실행 결과들 (입력 순서 유지)
         """
-        results = []
-        
-        for tool_info in selected_tools:
-            tool_name = tool_info['name']
-            tool_type = tool_info['type']
-            parameters = tool_info['parameters']
-            reason = tool_info['reason']
-            
-            try:
-                self.logger.info(f"툴 실행 시작: {tool_name}", 
-                               tool_type=tool_type,
-                               parameters=parameters,
-                               reason=reason)
-                
-                if tool_type == 'local':
-                    result = await self.execute_local_tool(tool_name, selection_reason=reason, **parameters)
-                elif tool_type == 'mcp':
-                    # TODO: MCP 툴 실행 로직 구현
-                    result = f"MCP 툴 '{tool_name}' 실행은 향후 구현 예정"
-                else:
-                    raise ValueError(f"알 수 없는 툴 타입: {tool_type}")
-                
-                results.append({
-                    'tool_name': tool_name,
-                    'tool_type': tool_type,
-                    'parameters': parameters,
-                    'result': result,
-                    'success': True,
-                    'reason': reason
-                })
-                
-            except Exception as e:
-                error_msg = f"툴 실행 실패: {str(e)}"
-                self.logger.error(f"툴 실행 오류: {tool_name}", 
-                                error=str(e),
-                                tool_type=tool_type,
-                                parameters=parameters)
-                
-                results.append({
-                    'tool_name': tool_name,
-                    'tool_type': tool_type,
-                    'parameters': parameters,
-                    'result': error_msg,
-                    'success': False,
-                    'reason': reason,
-                    'error': str(e)
-                })
-        
-        return results
+        return await self._execute_selected_tools_safely(selected_tools)
     
     async def _integrate_tool_results(self, original_message: str, 
                                     selected_tools: List[Dict[str, Any]], 
@@ -1146,9 +1661,10 @@ class StrandsAgentManager:
         if not results:
             return "실행할 수 있는 툴이 없습니다."
         
-        # 성공한 결과와 실패한 결과 분리
-        successful_results = [r for r in results if r['success']]
-        failed_results = [r for r in results if not r['success']]
+        # 성공한 결과와 실패한 결과를 한 번의 순회로 분리
+        successful_results, failed_results = [], []
+        for r in results:
+            (successful_results if r['success'] else failed_results).append(r)
         
         response_parts = []
         
@@ -1156,35 +1672,14 @@ class StrandsAgentManager:
         if successful_results:
             if len(successful_results) == 1:
                 result = successful_results[0]
-                if result['tool_name'] == 'current_date':
-                    response_parts.append(f"오늘 날짜는 {result['result']}입니다.")
-                elif result['tool_name'] in ['add', 'subtract', 'multiply', 'divide']:
-                    operation_names = {
-                        'add': '덧셈',
-                        'subtract': '뺄셈', 
-                        'multiply': '곱셈',
-                        'divide': '나눗셈'
-                    }
-                    op_name = operation_names.get(result['tool_name'], '계산')
-                    params = result['parameters']
-                    response_parts.append(
-                        f"{params['a']} {self._get_operation_symbol(result['tool_name'])} {params['b']} = {result['result']}"
-                    )
-                else:
-                    response_parts.append(f"{result['tool_name']} 결과: {result['result']}")
+                fmt = _FORMATTERS.get(result['tool_name'], _fmt_generic)
+                response_parts.append(fmt(result, 0))
             else:
                 # 여러 결과 통합
                 response_parts.append("요청하신 작업들의 결과입니다:")
                 for i, result in enumerate(successful_results, 1):
-                    if result['tool_name'] == 'current_date':
-                        response_parts.append(f"{i}. 현재 날짜: {result['result']}")
-                    elif result['tool_name'] in ['add', 'subtract', 'multiply', 'divide']:
-                        params = result['parameters']
-                        response_parts.append(
-                            f"{i}. {params['a']} {self._get_operation_symbol(result['tool_name'])} {params['b']} = {result['result']}"
-                        )
-                    else:
-                        response_parts.append(f"{i}. {result['tool_name']}: {result['result']}")
+                    fmt = _FORMATTERS.get(result['tool_name'], _fmt_generic)
+                    response_parts.append(fmt(result, i))
         
         # 실패한 결과들 처리
         if failed_results:
@@ -1196,24 +1691,20 @@ class StrandsAgentManager:
             for result in failed_results:
                 response_parts.append(f"- {result['tool_name']}: {result['result']}")
         
+        final = '\n'.join(response_parts)
+        
         # 툴 사용 정보 로깅
         self.logger.info("결과 통합 완료",
                         total_tools=len(results),
                         successful_tools=len(successful_results),
                         failed_tools=len(failed_results),
-                        response_length=len('\n'.join(response_parts)))
+                        response_length=len(final))
         
-        return '\n'.join(response_parts)
+        return final
     
     def _get_operation_symbol(self, operation_name: str) -> str:
         """수학 연산 이름을 기호로 변환"""
-        symbols = {
-            'add': '+',
-            'subtract': '-',
-            'multiply': '×',
-            'divide': '÷'
-        }
-        return symbols.get(operation_name, '?')
+        return _OP_SYMBOLS.get(operation_name, '?')
     
     def get_tool_usage_statistics(self) -> Dict[str, Any]:
         """
@@ -1232,48 +1723,21 @@ class StrandsAgentManager:
             }
         
         total_executions = len(self.execution_logs)
-        tool_usage = {}
-        total_time = 0
-        successful_executions = 0
-        error_summary = {}
-        
-        for log in self.execution_logs:
-            # 툴별 사용 횟수
-            if log.tool_name not in tool_usage:
-                tool_usage[log.tool_name] = {
-                    "count": 0,
-                    "total_time": 0,
-                    "successes": 0,
-                    "errors": 0,
-                    "tool_type": log.tool_type
-                }
-            
-            tool_usage[log.tool_name]["count"] += 1
-            tool_usage[log.tool_name]["total_time"] += log.execution_time
-            total_time += log.execution_time
-            
-            # 성공/실패 카운트
-            if isinstance(log.result, str) and log.result.startswith("ERROR:"):
-                tool_usage[log.tool_name]["errors"] += 1
-                error_type = log.result.split(":")[1].strip() if ":" in log.result else "Unknown"
-                error_summary[error_type] = error_summary.get(error_type, 0) + 1
-            else:
-                tool_usage[log.tool_name]["successes"] += 1
-                successful_executions += 1
         
-        # 평균 실행 시간 계산
-        for tool_name in tool_usage:
-            tool_data = tool_usage[tool_name]
-            if tool_data["count"] > 0:
-                tool_data["average_time"] = tool_data["total_time"] / tool_data["count"]
-                tool_data["success_rate"] = tool_data["successes"] / tool_data["count"]
+        # 증분 갱신된 통계에 평균 실행 시간/성공률만 계산하여 추가
+        tool_usage = {}
+        for tool_name, tool_stats in self._stats.items():
+            tool_data = dict(tool_stats)
+            tool_data["average_time"] = tool_data["total_time"] / tool_data["count"]
+            tool_data["success_rate"] = tool_data["successes"] / tool_data["count"]
+            tool_usage[tool_name] = tool_data
         
         return {
             "total_executions": total_executions,
             "tool_usage": tool_usage,
-            "average_execution_time": total_time / total_executions if total_executions > 0 else 0,
-            "success_rate": successful_executions / total_executions if total_executions > 0 else 0,
-            "error_summary": error_summary,
+            "average_execution_time": self._total_time / total_executions,
+            "success_rate": self._successful_executions / total_executions,
+            "error_summary": dict(self._error_summary),
             "session_start_time": self.execution_logs[0].timestamp if self.execution_logs else None,
             "last_execution_time": self.execution_logs[-1].timestamp if self.execution_logs else None
         }
@@ -1288,18 +1752,18 @@ class StrandsAgentManager:
         Returns:
             List[Dict[str, Any]]: 최근 툴 활동
         """
-        # 최근 로그를 시간순으로 정렬하여 반환
-        sorted_logs = sorted(self.execution_logs, key=lambda x: x.timestamp, reverse=True)
+        # 로그는 실행 순서대로 추가되므로 뒤에서부터 limit개만 읽으면 최신순
+        recent_logs = islice(reversed(self.execution_logs), max(0, limit))
         
         recent_activity = []
-        for log in sorted_logs[:limit]:
+        for log in recent_logs:
             activity = {
                 'tool_name': log.tool_name,
                 'tool_type': log.tool_type,
                 'parameters': log.parameters,
                 'execution_time': log.execution_time,
                 'timestamp': log.timestamp,
-                'success': not (isinstance(log.result, str) and log.result.startswith("ERROR:")),
+                'success': log.success,
                 'result': log.result
             }
             recent_activity.append(activity)
@@ -1328,33 +1792,46 @@ class StrandsAgentManager:
                            selection_reason=tool['reason'],
                            parameters=tool['parameters'])
         
-        # 선택되지 않은 툴들에 대한 분석도 로깅
-        all_available_tools = set(self.local_tools.keys())
-        selected_tool_names = {tool['name'] for tool in selected_tools if tool['type'] == 'local'}
-        unselected_tools = all_available_tools - selected_tool_names
-        
-        if unselected_tools:
-            self.logger.debug("선택되지 않은 로컬 툴들",
-                            unselected_tools=list(unselected_tools),
-                            reason="메시지 패턴과 매치되지 않음")
+        # 선택되지 않은 툴들에 대한 분석도 로깅 (DEBUG가 꺼져 있으면 집합 연산 생략)
+        if self._debug_enabled:
+            unselected_tools = self._local_tool_names.difference(
+                tool['name'] for tool in selected_tools if tool['type'] == 'local'
+            )
+            if unselected_tools:
+                self.logger.debug("선택되지 않은 로컬 툴들",
+                                unselected_tools=list(unselected_tools),
+                                reason="메시지 패턴과 매치되지 않음")
     
-    def log_result_integration_process(self, results: List[Dict[str, Any]], final_response: str) -> None:
+    def log_result_integration_process(self, results: List[Dict[str, Any]], final_response: str,
+                                       successful_count: Optional[int] = None,
+                                       failed_count: Optional[int] = None) -> None:
         """
         결과 통합 과정을 상세히 로깅
         
         Args:
             results: 툴 실행 결과들
             final_response: 최종 통합된 응답
-        """
-        successful_results = [r for r in results if r['success']]
-        failed_results = [r for r in results if not r['success']]
+            successful_count: 호출 측에서 이미 집계한 성공 개수 (없으면 직접 집계)
+            failed_count: 호출 측에서 이미 집계한 실패 개수 (없으면 직접 집계)
+        """
+        if successful_count is None or failed_count is None:
+            successful_count = failed_count = 0
+            for r in results:
+                if r['success']:
+                    successful_count += 1
+                else:
+                    failed_count += 1
         
         self.logger.info("결과 통합 과정",
                         total_results=len(results),
-                        successful_results=len(successful_results),
-                        failed_results=len(failed_results),
+                        successful_results=successful_count,
+                        failed_results=failed_count,
                         final_response_length=len(final_response))
         
+        # 이하 상세 로그는 모두 DEBUG 레벨
+        if not self._debug_enabled:
+            return
+        
         # 각 결과의 통합 방식 로깅
         for result in results:
             self.logger.debug("개별 결과 처리",
@@ -1364,62 +1841,75 @@ class StrandsAgentManager:
                             result_length=len(str(result['result'])))
         
         # 응답 생성 전략 로깅
-        if len(successful_results) == 1:
+        if successful_count == 1:
             self.logger.debug("단일 결과 응답 생성", strategy="single_result")
-        elif len(successful_results) > 1:
+        elif successful_count > 1:
             self.logger.debug("다중 결과 통합 응답 생성", strategy="multiple_results")
         
-        if failed_results:
+        if failed_count:
             self.logger.debug("실패 결과 포함 응답 생성", 
-                            failed_count=len(failed_results),
+                            failed_count=failed_count,
                             strategy="error_handling")
     
-    def export_execution_logs(self, format: str = "json") -> str:
+    def export_execution_logs(self, format: str = "json", out: Optional[IO[str]] = None) -> Optional[str]:
         """
         실행 로그를 지정된 형식으로 내보내기
         
+        전체 로그를 한 번에 문자열 목록으로 만들지 않고 한 줄(항목)씩 기록합니다.
+        
         Args:
             format: 내보낼 형식 ("json", "csv", "text")
+            out: 기록할 텍스트 스트림 (없으면 문자열로 반환)
             
         Returns:
-            str: 형식화된 로그 데이터
+            Optional[str]: out이 없으면 형식화된 로그 데이터, 있으면 None
         """
         if not self.execution_logs:
-            return "실행 로그가 없습니다."
+            if out is None:
+                return "실행 로그가 없습니다."
+            out.write("실행 로그가 없습니다.")
+            return None
         
-        if format.lower() == "json":
-            import json
-            log_data = []
-            for log in self.execution_logs:
-                log_data.append({
+        fmt = format.lower()
+        if fmt not in ("json", "csv", "text"):
+            raise ValueError(f"지원하지 않는 형식: {format}")
+        
+        target = out if out is not None else io.StringIO()
+        
+        if fmt == "json":
+            # json.dumps(목록, indent=2)와 같은 출력을 항목 단위로 기록
+            target.write("[\n")
+            for i, log in enumerate(self.execution_logs):
+                if i:
+                    target.write(",\n")
+                entry = json.dumps({
                     "timestamp": log.timestamp.isoformat(),
                     "tool_name": log.tool_name,
                     "tool_type": log.tool_type,
                     "parameters": log.parameters,
                     "execution_time": log.execution_time,
                     "result": str(log.result)
-                })
-            return json.dumps(log_data, indent=2, ensure_ascii=False)
-        
-        elif format.lower() == "csv":
-            lines = ["timestamp,tool_name,tool_type,execution_time,parameters,result"]
+                }, indent=2, ensure_ascii=False)
+                target.write("  " + entry.replace("\n", "\n  "))
+            target.write("\n]")
+        
+        elif fmt == "csv":
+            # csv.writer가 쉼표/따옴표가 포함된 값을 올바르게 인용
+            writer = csv.writer(target, lineterminator="\n")
+            writer.writerow(["timestamp", "tool_name", "tool_type", "execution_time", "parameters", "result"])
             for log in self.execution_logs:
-                lines.append(f"{log.timestamp.isoformat()},{log.tool_name},{log.tool_type},"
-                           f"{log.execution_time},\"{log.parameters}\",\"{str(log.result)}\"")
-            return "\n".join(lines)
+                writer.writerow([log.timestamp.isoformat(), log.tool_name, log.tool_type,
+                                 log.execution_time, log.parameters, log.result])
         
-        elif format.lower() == "text":
-            lines = ["=== 툴 실행 로그 ===\n"]
+        else:
+            target.write("=== 툴 실행 로그 ===\n\n")
             for i, log in enumerate(self.execution_logs, 1):
-                lines.append(f"{i}. [{log.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] "
-                           f"{log.tool_name} ({log.tool_type}) - {log.execution_time:.3f}초")
-                lines.append(f"   매개변수: {log.parameters}")
-                lines.append(f"   결과: {log.result}")
-                lines.append("")
-            return "\n".join(lines)
+                target.write(f"{i}. [{log.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] "
+                             f"{log.tool_name} ({log.tool_type}) - {log.execution_time:.3f}초\n")
+                target.write(f"   매개변수: {log.parameters}\n")
+                target.write(f"   결과: {log.result}\n\n")
         
-        else:
-            raise ValueError(f"지원하지 않는 형식: {format}")
+        return target.getvalue() if out is None else None
     
     async def monitor_system_health(self) -> Dict[str, Any]:
         """
@@ -1440,13 +1930,13 @@ class StrandsAgentManager:
             },
             "execution_logs": {
                 "total_count": len(self.execution_logs),
-                "memory_usage": f"{len(str(self.execution_logs))} bytes"
+                "memory_usage": f"{len(self.execution_logs) * _APPROX_LOG_BYTES} bytes"
             }
         }
         
         # 최근 에러 체크
-        recent_errors = [log for log in self.execution_logs[-10:] 
-                        if isinstance(log.result, str) and log.result.startswith("ERROR:")]
+        recent_logs = islice(self.execution_logs, max(0, len(self.execution_logs) - 10), None)
+        recent_errors = [log for log in recent_logs if log.is_error]
         
         if recent_errors:
             health_status["recent_errors"] = {
@@ -1457,7 +1947,7 @@ class StrandsAgentManager:
         
         # 성능 체크
         if self.execution_logs:
-            avg_time = sum(log.execution_time for log in self.execution_logs) / len(self.execution_logs)
+            avg_time = self._total_time / len(self.execution_logs)
             if avg_time > 2.0:  # 평균 2초 이상
                 health_status["performance"] = {
                     "average_execution_time": avg_time,
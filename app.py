@@ -1,129 +1,129 @@
 # Streamlit 메인 애플리케이션
 
+import os
 import streamlit as st
 import asyncio
+import concurrent.futures
+import threading
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 from agent import StrandsAgentManager
 
+# uvloop은 선택 의존성 (get_bg_loop에서 사용, 설치되지 않았거나 STRANDS_DISABLE_UVLOOP=1이면 기본 루프 사용)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# 영역별 부분 재실행 (st.fragment는 Streamlit 1.37+, 이전 버전은 experimental_fragment 또는 일반 함수로 실행)
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# 페이지 설정
+_PAGE_CONFIG = {
+    "page_title": "Strands Agent 챗봇",
+    "page_icon": "🤖",
+    "layout": "wide",
+    "initial_sidebar_state": "collapsed",
+}
+
+# 입력 메시지 최대 길이
+_MAX_CHARS = 10000
+
+# 입력창 placeholder 예시 (세션마다 하나를 골라 고정)
+_PLACEHOLDERS = (
+    "오늘 날짜 알려줘",
+    "15 + 25는 얼마야?",
+    "100 나누기 4",
+    "현재 날짜와 3 × 7 계산해줘",
+)
+
+# 빠른 예시 버튼 (버튼 라벨, 전송할 메시지)
+_QUICK_EXAMPLES = (
+    ("📅 오늘 날짜", "오늘 날짜 알려줘"),
+    ("🧮 10 + 5", "10 + 5는 얼마야?"),
+    ("✖️ 7 × 8", "7 곱하기 8"),
+    ("🔄 복합 요청", "오늘 날짜와 15 + 25 계산해줘"),
+)
+
+# 채팅 기록을 한 번에 표시할 메시지 수 ("더 보기"를 누를 때마다 이만큼 늘어남)
+_HISTORY_PAGE = 20
+
+# 사이드바 도움말 (기본 기능 안내, 팁과 주의사항, 문제 해결 가이드)
+_FEATURES_MD = """
+**🗓️ 날짜 조회**
+- '오늘 날짜 알려줘'
+- '현재 날짜는?'
+
+**🧮 수학 계산**
+- '15 + 25는 얼마야?'
+- '100 나누기 4'
+- '3.14 × 2'
+
+**🔄 복합 요청**
+- '오늘 날짜와 10 * 5 계산해줘'
+- '현재 날짜 알려주고 50 - 20도 계산해줘'
+"""
+
+_TIPS_MD = """
+**✅ 효과적인 사용법**
+- 명확하고 구체적인 요청을 하세요
+- 한 번에 여러 작업을 요청할 수 있습니다
+- 계산 시 숫자와 연산자를 명확히 구분하세요
+
+**⚠️ 주의사항**
+- 0으로 나누기는 불가능합니다
+- 매우 큰 숫자는 처리 시간이 오래 걸릴 수 있습니다
+- 네트워크 문제 시 일부 기능이 제한될 수 있습니다
+"""
+
+_TROUBLE_MD = """
+**🌐 연결 문제**
+- 인터넷 연결을 확인하세요
+- 페이지를 새로고침해보세요
+- MCP 서버 재연결 버튼을 사용하세요
+
+**⏰ 응답 지연**
+- 더 간단한 요청을 시도해보세요
+- 잠시 후 다시 시도하세요
+- 채팅을 초기화하고 다시 시작하세요
+
+**❌ 오류 발생**
+- 요청 내용을 다시 확인하세요
+- 다른 방식으로 표현해보세요
+- 시스템 상태를 확인하세요
+"""
+
+_SIDEBAR_HELP = (
+    ("📋 사용 가능한 기능", _FEATURES_MD),
+    ("💡 사용 팁", _TIPS_MD),
+    ("🔧 문제 해결", _TROUBLE_MD),
+)
+
+# 에러 타입별 배지 (표시 함수, 문구)
+_ERR_BADGE = {
+    "connection": (st.error, "🌐 연결 오류"),
+    "timeout": (st.warning, "⏰ 시간 초과"),
+    "memory": (st.error, "💾 메모리 부족"),
+    "initialization": (st.warning, "🔧 초기화 오류"),
+    "processing": (st.warning, "⚠️ 처리 오류"),
+}
+
 def main():
     """메인 애플리케이션 진입점"""
     # Streamlit 페이지 설정
-    st.set_page_config(
-        page_title="Strands Agent 챗봇",
-        page_icon="🤖",
-        layout="wide",
-        initial_sidebar_state="collapsed"
-    )
+    st.set_page_config(**_PAGE_CONFIG)
     
     # 세션 상태 초기화
     initialize_session_state()
     
-    # 사이드바 - 에이전트 상태 및 정보
+    # 빠른 예시 버튼으로 예약된 메시지 처리 (클릭으로 인한 재실행 한 번에 처리)
+    pending_prompt = st.session_state.pop("_pending_prompt", None)
+    if pending_prompt:
+        handle_user_input(pending_prompt)
+    
+    # 사이드바 - 에이전트 상태 및 정보 (사이드바 조작은 사이드바만 다시 실행)
     with st.sidebar:
-        st.header("🔧 에이전트 상태")
-        
-        # 에이전트 초기화 상태
-        if st.session_state.agent_initialized:
-            st.success("✅ 에이전트 초기화 완료")
-            
-            # 사용 가능한 툴 정보 표시
-            if st.session_state.agent_manager:
-                tools_info = st.session_state.agent_manager.get_available_tools()
-                
-                st.subheader("📊 사용 가능한 툴")
-                st.write(f"**로컬 툴**: {tools_info['local_tools']['count']}개")
-                with st.expander("로컬 툴 목록"):
-                    for tool in tools_info['local_tools']['tools']:
-                        st.write(f"• {tool}")
-                
-                mcp_status = "🟢 연결됨" if tools_info['mcp_tools']['connected'] else "🔴 연결 안됨"
-                st.write(f"**MCP 서버**: {mcp_status}")
-                
-                # 툴 사용 통계
-                if st.button("📈 사용 통계 보기"):
-                    stats = st.session_state.agent_manager.get_tool_usage_statistics()
-                    if stats['total_executions'] > 0:
-                        st.write(f"**총 실행 횟수**: {stats['total_executions']}")
-                        st.write(f"**성공률**: {stats['success_rate']:.1%}")
-                        st.write(f"**평균 실행 시간**: {stats['average_execution_time']:.3f}초")
-                    else:
-                        st.write("아직 툴 사용 기록이 없습니다.")
-        else:
-            st.warning("⏳ 에이전트 초기화 대기 중")
-        
-        st.markdown("---")
-        
-        # 도움말 및 사용 가이드
-        st.subheader("💡 사용 가이드")
-        
-        # 기본 기능 안내
-        with st.expander("📋 사용 가능한 기능", expanded=False):
-            st.markdown("""
-            **🗓️ 날짜 조회**
-            - '오늘 날짜 알려줘'
-            - '현재 날짜는?'
-            
-            **🧮 수학 계산**
-            - '15 + 25는 얼마야?'
-            - '100 나누기 4'
-            - '3.14 × 2'
-            
-            **🔄 복합 요청**
-            - '오늘 날짜와 10 * 5 계산해줘'
-            - '현재 날짜 알려주고 50 - 20도 계산해줘'
-            """)
-        
-        # 팁과 주의사항
-        with st.expander("💡 사용 팁", expanded=False):
-            st.markdown("""
-            **✅ 효과적인 사용법**
-            - 명확하고 구체적인 요청을 하세요
-            - 한 번에 여러 작업을 요청할 수 있습니다
-            - 계산 시 숫자와 연산자를 명확히 구분하세요
-            
-            **⚠️ 주의사항**
-            - 0으로 나누기는 불가능합니다
-            - 매우 큰 숫자는 처리 시간이 오래 걸릴 수 있습니다
-            - 네트워크 문제 시 일부 기능이 제한될 수 있습니다
-            """)
-        
-        # 문제 해결 가이드
-        with st.expander("🔧 문제 해결", expanded=False):
-            st.markdown("""
-            **🌐 연결 문제**
-            - 인터넷 연결을 확인하세요
-            - 페이지를 새로고침해보세요
-            - MCP 서버 재연결 버튼을 사용하세요
-            
-            **⏰ 응답 지연**
-            - 더 간단한 요청을 시도해보세요
-            - 잠시 후 다시 시도하세요
-            - 채팅을 초기화하고 다시 시작하세요
-            
-            **❌ 오류 발생**
-            - 요청 내용을 다시 확인하세요
-            - 다른 방식으로 표현해보세요
-            - 시스템 상태를 확인하세요
-            """)
-        
-        # 현재 시스템 상태 요약
-        if st.session_state.agent_initialized and st.session_state.agent_manager:
-            st.subheader("📊 시스템 상태")
-            mcp_status = st.session_state.agent_manager.get_mcp_status()
-            
-            if mcp_status["connected"]:
-                st.success("🟢 모든 기능 사용 가능")
-            else:
-                st.warning("🟡 로컬 기능만 사용 가능")
-                st.info("날짜 조회와 수학 계산은 정상 작동합니다")
-            
-            # 최근 활동 요약
-            stats = st.session_state.agent_manager.get_tool_usage_statistics()
-            if stats['total_executions'] > 0:
-                st.write(f"**이번 세션**: 툴 {stats['total_executions']}회 실행, 성공률 {stats['success_rate']:.1%}")
-        else:
-            st.info("🔄 첫 메시지를 보내면 시스템이 초기화됩니다")
+        render_sidebar()
     
     # 페이지 제목과 컨트롤
     col1, col2 = st.columns([4, 1])
@@ -142,90 +142,116 @@ def main():
     # 채팅 기록 표시
     display_chat_history()
     
-    # 사용자 입력창 (향상된 UI)
+    # 사용자 입력 보조 UI
     with st.container():
         # 입력 도움말
         if not st.session_state.messages or len(st.session_state.messages) <= 1:
             st.info("💬 첫 메시지를 보내보세요! 예: '오늘 날짜 알려줘' 또는 '10 + 5는?'")
         
-        col1, col2, col3 = st.columns([3, 1, 0.5])
-        
-        with col1:
-            # 동적 placeholder 생성
-            placeholder_examples = [
-                "오늘 날짜 알려줘",
-                "15 + 25는 얼마야?",
-                "100 나누기 4",
-                "현재 날짜와 3 × 7 계산해줘"
-            ]
-            
-            import random
-            current_placeholder = random.choice(placeholder_examples)
-            
-            user_input = st.text_input(
-                "메시지를 입력하세요...",
-                key="user_input",
-                placeholder=f"예: {current_placeholder}",
-                label_visibility="collapsed",
-                help="Enter 키를 눌러서도 전송할 수 있습니다"
-            )
-        
-        with col2:
-            send_button = st.button("📤 전송", type="primary", use_container_width=True)
-        
-        with col3:
-            # 빠른 예시 버튼
-            if st.button("💡", help="빠른 예시", use_container_width=True):
-                st.session_state.show_quick_examples = not st.session_state.get('show_quick_examples', False)
+        # 빠른 예시 버튼
+        if st.button("💡 빠른 예시", help="빠른 예시"):
+            st.session_state.show_quick_examples = not st.session_state.show_quick_examples
         
         # 빠른 예시 버튼들
-        if st.session_state.get('show_quick_examples', False):
+        if st.session_state.show_quick_examples:
             st.markdown("**빠른 예시:**")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                if st.button("📅 오늘 날짜", use_container_width=True):
-                    st.session_state.user_input = "오늘 날짜 알려줘"
-                    handle_user_input("오늘 날짜 알려줘")
-                    st.rerun()
-            
-            with col2:
-                if st.button("🧮 10 + 5", use_container_width=True):
-                    st.session_state.user_input = "10 + 5는 얼마야?"
-                    handle_user_input("10 + 5는 얼마야?")
-                    st.rerun()
-            
-            with col3:
-                if st.button("✖️ 7 × 8", use_container_width=True):
-                    st.session_state.user_input = "7 곱하기 8"
-                    handle_user_input("7 곱하기 8")
-                    st.rerun()
-            
-            with col4:
-                if st.button("🔄 복합 요청", use_container_width=True):
-                    st.session_state.user_input = "오늘 날짜와 15 + 25 계산해줘"
-                    handle_user_input("오늘 날짜와 15 + 25 계산해줘")
-                    st.rerun()
+            # 클릭 콜백은 재실행 전에 실행되므로 메시지만 예약하고, 처리는 main() 시작 시 수행
+            for col, (label, text) in zip(st.columns(len(_QUICK_EXAMPLES)), _QUICK_EXAMPLES):
+                with col:
+                    st.button(label, use_container_width=True,
+                              on_click=_queue_prompt, args=(text,))
+    
+    # 사용자 입력창 (제출 시에만 재실행되며, 입력 길이는 max_chars로 제한)
+    if prompt := st.chat_input(f"메시지를 입력하세요... (예: {st.session_state._ph})", max_chars=_MAX_CHARS):
+        handle_user_input(prompt.strip())
+        st.rerun()
+
+@_fragment
+def render_sidebar():
+    """사이드바 렌더링 (에이전트 상태, 툴 정보, 사용 가이드)"""
+    st.header("🔧 에이전트 상태")
+    
+    # 에이전트 초기화 상태
+    if st.session_state.agent_initialized:
+        st.success("✅ 에이전트 초기화 완료")
         
-        # 입력 길이 표시
-        if user_input:
-            char_count = len(user_input)
-            max_chars = 10000
+        # 사용 가능한 툴 정보 표시
+        if st.session_state.agent_manager:
+            tools_info = _cached_tools_info(
+                st.session_state.agent_manager,
+                st.session_state.session_id,
+                st.session_state.stats_version
+            )
             
-            if char_count > max_chars * 0.8:  # 80% 이상일 때 경고
-                color = "red" if char_count > max_chars else "orange"
-                st.markdown(f"<small style='color:{color}'>글자 수: {char_count}/{max_chars}</small>", 
-                          unsafe_allow_html=True)
-    
-    # 사용자 입력 처리 (Enter 키 지원)
-    if (send_button or user_input.endswith('\n')) and user_input.strip():
-        # Enter로 전송된 경우 개행 문자 제거
-        clean_input = user_input.strip().rstrip('\n')
-        if clean_input:
-            handle_user_input(clean_input)
-            # 입력창 초기화
-            st.session_state.user_input = ""
-            st.rerun()
+            st.subheader("📊 사용 가능한 툴")
+            st.write(f"**로컬 툴**: {tools_info['local_tools']['count']}개")
+            with st.expander("로컬 툴 목록"):
+                for tool in tools_info['local_tools']['tools']:
+                    st.write(f"• {tool}")
+            
+            mcp_status = "🟢 연결됨" if tools_info['mcp_tools']['connected'] else "🔴 연결 안됨"
+            st.write(f"**MCP 서버**: {mcp_status}")
+            
+            # 툴 사용 통계
+            if st.button("📈 사용 통계 보기"):
+                stats = _cached_stats(
+                    st.session_state.agent_manager,
+                    st.session_state.session_id,
+                    st.session_state.stats_version
+                )
+                if stats['total_executions'] > 0:
+                    st.write(f"**총 실행 횟수**: {stats['total_executions']}")
+                    st.write(f"**성공률**: {stats['success_rate']:.1%}")
+                    st.write(f"**평균 실행 시간**: {stats['average_execution_time']:.3f}초")
+                else:
+                    st.write("아직 툴 사용 기록이 없습니다.")
+    else:
+        st.warning("⏳ 에이전트 초기화 대기 중")
+    
+    st.markdown("---")
+    
+    # 도움말 및 사용 가이드
+    st.subheader("💡 사용 가이드")
+    
+    # 기능 안내 / 사용 팁 / 문제 해결 가이드
+    for title, md in _SIDEBAR_HELP:
+        with st.expander(title, expanded=False):
+            st.markdown(md)
+    
+    # 현재 시스템 상태 요약
+    if st.session_state.agent_initialized and st.session_state.agent_manager:
+        st.subheader("📊 시스템 상태")
+        mcp_status = _cached_mcp_status(
+            st.session_state.agent_manager,
+            st.session_state.session_id,
+            st.session_state.stats_version
+        )
+        
+        if mcp_status["connected"]:
+            st.success("🟢 모든 기능 사용 가능")
+        else:
+            st.warning("🟡 로컬 기능만 사용 가능")
+            st.info("날짜 조회와 수학 계산은 정상 작동합니다")
+        
+        # 최근 활동 요약
+        stats = _cached_stats(
+            st.session_state.agent_manager,
+            st.session_state.session_id,
+            st.session_state.stats_version
+        )
+        if stats['total_executions'] > 0:
+            st.write(f"**이번 세션**: 툴 {stats['total_executions']}회 실행, 성공률 {stats['success_rate']:.1%}")
+    else:
+        st.info("🔄 첫 메시지를 보내면 시스템이 초기화됩니다")
+
+def _queue_prompt(text: str):
+    """빠른 예시 버튼 콜백: 다음 재실행에서 처리할 메시지 예약"""
+    st.session_state._pending_prompt = text
+
+def _stamp() -> Dict:
+    """메시지 생성 시각과 표시용 문자열 (렌더링 때마다 strftime하지 않도록 미리 계산)"""
+    now = datetime.now()
+    return {"timestamp": now, "ts_str": now.strftime('%H:%M:%S')}
 
 def initialize_session_state():
     """세션 상태 초기화"""
@@ -234,57 +260,104 @@ def initialize_session_state():
             {
                 "role": "assistant",
                 "content": "안녕하세요! Strands Agent 챗봇입니다. 무엇을 도와드릴까요?",
-                "timestamp": datetime.now()
+                **_stamp()
             }
         ]
     
     if "session_id" not in st.session_state:
         st.session_state.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
+    # 세션별 placeholder 예시 (재실행마다 다시 고르지 않음)
+    if "_ph" not in st.session_state:
+        st.session_state._ph = _PLACEHOLDERS[hash(st.session_state.session_id) % len(_PLACEHOLDERS)]
+    
     if "agent_manager" not in st.session_state:
         st.session_state.agent_manager = None
         st.session_state.agent_initialized = False
+    
+    # 채팅 기록 표시 범위 (최근 메시지 수)
+    st.session_state.setdefault("history_window", _HISTORY_PAGE)
+    
+    # 툴/통계/상태 캐시 무효화용 버전 (응답 처리나 채팅 초기화 시 증가)
+    st.session_state.setdefault("stats_version", 0)
+    
+    # 빠른 예시 버튼 표시 여부
+    st.session_state.setdefault("show_quick_examples", False)
+
+def bump_stats_version():
+    """매니저 상태가 바뀌었음을 알려 캐시된 툴/통계/상태 조회를 무효화"""
+    st.session_state.stats_version += 1
+
+# 위젯 조작으로 인한 재실행마다 매니저를 다시 조회하지 않도록 짧게 캐시
+# (_manager는 해시 대상에서 제외되며, session_id와 stats_version이 캐시 키)
+@st.cache_data(ttl=2, show_spinner=False)
+def _cached_tools_info(_manager, session_id: str, version: int) -> Dict:
+    """캐시된 사용 가능한 툴 정보"""
+    return _manager.get_available_tools()
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _cached_stats(_manager, session_id: str, version: int) -> Dict:
+    """캐시된 툴 사용 통계"""
+    return _manager.get_tool_usage_statistics()
+
+@st.cache_data(ttl=2, show_spinner=False)
+def _cached_mcp_status(_manager, session_id: str, version: int) -> Dict:
+    """캐시된 MCP 연결 상태"""
+    return _manager.get_mcp_status()
 
 @st.cache_resource
-def get_agent_manager():
-    """에이전트 매니저 인스턴스를 캐시하여 반환"""
-    return StrandsAgentManager()
+def get_initialized_manager() -> StrandsAgentManager:
+    """
+    초기화가 끝난 에이전트 매니저 반환
+    
+    프로세스당 한 번만 생성/초기화하여 모든 세션과 재실행이 공유하므로,
+    채팅 초기화나 새 세션마다 MCP 서버 연결을 다시 수행하지 않습니다.
+    """
+    manager = StrandsAgentManager()
+    run_async_function(manager.initialize())
+    return manager
+
+def initialize_agent():
+    """에이전트 초기화 (프로세스 단위로 캐시된 초기화 매니저를 세션에 연결)"""
+    st.session_state.agent_manager = get_initialized_manager()
+    st.session_state.agent_initialized = True
 
-async def initialize_agent():
-    """에이전트 초기화 (비동기)"""
-    if st.session_state.agent_manager is None:
-        st.session_state.agent_manager = get_agent_manager()
+@st.cache_resource
+def get_bg_loop() -> asyncio.AbstractEventLoop:
+    """
+    앱 전체에서 공유하는 백그라운드 이벤트 루프 반환
     
-    if not st.session_state.agent_initialized:
-        await st.session_state.agent_manager.initialize()
-        st.session_state.agent_initialized = True
+    전용 데몬 스레드에서 루프를 계속 실행하므로 요청마다 스레드/루프를 새로 만들지 않고,
+    MCP 세션과 HTTP 커넥션 풀도 같은 루프에서 재사용됩니다.
+    """
+    # 전역 정책은 건드리지 않고 이 루프만 uvloop으로 생성
+    if uvloop is not None and os.getenv("STRANDS_DISABLE_UVLOOP") != "1":
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="agent-event-loop", daemon=True).start()
+    return loop
 
-def run_async_function(coro):
-    """비동기 함수를 동기 방식으로 실행"""
+def _submit(coro) -> concurrent.futures.Future:
+    """
+    코루틴을 백그라운드 이벤트 루프에 제출
+    
+    Raises:
+        RuntimeError: 백그라운드 루프 스레드 안에서 호출된 경우 (결과를 기다리면 교착 상태)
+    """
+    loop = get_bg_loop()
     try:
-        # 기존 이벤트 루프가 있는지 확인
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # 이미 실행 중인 루프가 있으면 새 스레드에서 실행
-            import concurrent.futures
-            import threading
-            
-            def run_in_thread():
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    return new_loop.run_until_complete(coro)
-                finally:
-                    new_loop.close()
-            
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_in_thread)
-                return future.result()
-        else:
-            return loop.run_until_complete(coro)
+        running = asyncio.get_running_loop()
     except RuntimeError:
-        # 이벤트 루프가 없으면 새로 생성
-        return asyncio.run(coro)
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("백그라운드 이벤트 루프 안에서는 동기 실행 함수를 사용할 수 없습니다. await를 사용하세요.")
+    return asyncio.run_coroutine_threadsafe(coro, loop)
+
+def run_async_function(coro):
+    """비동기 함수를 백그라운드 이벤트 루프에서 실행하고 결과를 기다림"""
+    return _submit(coro).result()
 
 def reset_chat_history():
     """채팅 기록 초기화"""
@@ -292,10 +365,12 @@ def reset_chat_history():
         {
             "role": "assistant",
             "content": "채팅이 초기화되었습니다. 새로운 대화를 시작해보세요!",
-            "timestamp": datetime.now()
+            **_stamp()
         }
     ]
     st.session_state.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    st.session_state.history_window = _HISTORY_PAGE
+    bump_stats_version()
 
 def display_chat_history():
     """채팅 기록 표시"""
@@ -306,8 +381,16 @@ def display_chat_history():
         st.info("아직 메시지가 없습니다. 첫 메시지를 보내보세요!")
         return
     
+    # 최근 history_window개 메시지만 렌더링 (오래된 메시지는 요청 시에만 표시)
+    messages = st.session_state.messages
+    start = max(0, len(messages) - st.session_state.history_window)
+    if start > 0:
+        if st.button(f"⬆️ 이전 메시지 더 보기 ({start}개)", key="load_older_messages"):
+            st.session_state.history_window += _HISTORY_PAGE
+            st.rerun()
+    
     # 채팅 메시지들을 순서대로 표시
-    for message in st.session_state.messages:
+    for message in messages[start:]:
         display_message(message)
 
 def handle_user_input(user_input: str):
@@ -317,15 +400,15 @@ def handle_user_input(user_input: str):
         st.warning("메시지를 입력해주세요.")
         return
     
-    if len(user_input) > 10000:
-        st.error("메시지가 너무 깁니다. 10,000자 이하로 입력해주세요.")
+    if len(user_input) > _MAX_CHARS:
+        st.error(f"메시지가 너무 깁니다. {_MAX_CHARS:,}자 이하로 입력해주세요.")
         return
     
     # 사용자 메시지를 세션 상태에 추가
     user_message = {
         "role": "user",
         "content": user_input,
-        "timestamp": datetime.now()
+        **_stamp()
     }
     st.session_state.messages.append(user_message)
     
@@ -333,12 +416,12 @@ def handle_user_input(user_input: str):
     if not st.session_state.agent_initialized:
         with st.spinner("에이전트를 초기화하는 중..."):
             try:
-                run_async_function(initialize_agent())
+                initialize_agent()
             except ConnectionError:
                 error_response = {
                     "role": "assistant",
                     "content": "네트워크 연결에 문제가 있습니다. 인터넷 연결을 확인하고 다시 시도해주세요.",
-                    "timestamp": datetime.now(),
+                    **_stamp(),
                     "error_type": "connection"
                 }
                 st.session_state.messages.append(error_response)
@@ -347,7 +430,7 @@ def handle_user_input(user_input: str):
                 error_response = {
                     "role": "assistant",
                     "content": "초기화 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
-                    "timestamp": datetime.now(),
+                    **_stamp(),
                     "error_type": "timeout"
                 }
                 st.session_state.messages.append(error_response)
@@ -356,84 +439,61 @@ def handle_user_input(user_input: str):
                 error_response = {
                     "role": "assistant",
                     "content": generate_user_friendly_error_message(e, "initialization"),
-                    "timestamp": datetime.now(),
+                    **_stamp(),
                     "error_type": "initialization"
                 }
                 st.session_state.messages.append(error_response)
                 return
     
-    # 에이전트를 통한 메시지 처리 (향상된 UI 피드백)
-    progress_container = st.empty()
-    status_container = st.empty()
+    # 이번 요청에서 기록될 로그의 시작 위치
+    log_cursor = st.session_state.agent_manager.log_cursor()
     
     try:
-        # 처리 단계별 진행 상황 표시
-        with progress_container.container():
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            status_text.text("🔍 메시지 분석 중...")
-            progress_bar.progress(20)
-            
-            # 비동기 에이전트 호출을 동기 방식으로 처리 (타임아웃 적용)
-            status_text.text("🛠️ 적절한 툴 선택 중...")
-            progress_bar.progress(40)
-            
-            status_text.text("⚙️ 툴 실행 중...")
-            progress_bar.progress(60)
-            
-            response = run_async_function_with_timeout(
-                st.session_state.agent_manager.process_message(user_input),
+        # 실제 진행 단계를 알 수 없으므로 단일 스피너로 표시 (단계별 프런트엔드 갱신 제거)
+        with st.spinner("처리 중..."):
+            # 응답과 에이전트 상태/툴 사용 정보를 한 번의 백그라운드 호출로 수집
+            response, snapshot = run_async_function_with_timeout(
+                st.session_state.agent_manager.process_message_with_snapshot(user_input, log_cursor),
                 timeout=60  # 60초 타임아웃
             )
-            
-            status_text.text("📝 응답 생성 중...")
-            progress_bar.progress(80)
-            
-            # 에이전트 상태 및 툴 사용 정보 수집
-            agent_status = st.session_state.agent_manager.get_mcp_status()
-            recent_logs = st.session_state.agent_manager.get_recent_tool_activity(limit=5)
-            
-            status_text.text("✅ 완료!")
-            progress_bar.progress(100)
-            
-            # 사용된 툴 정보 추출
-            tool_info = []
-            for log in recent_logs:
-                if log['timestamp'] > user_message['timestamp']:  # 이번 요청에서 사용된 툴만
-                    tool_info.append({
-                        'name': log['tool_name'],
-                        'type': log['tool_type'],
-                        'success': not (isinstance(log.get('result'), str) and log['result'].startswith("ERROR:")),
-                        'execution_time': log['execution_time'],
-                        'reason': log.get('reason', '알 수 없음'),
-                        'error': log.get('result') if isinstance(log.get('result'), str) and log['result'].startswith("ERROR:") else None
-                    })
-            
-            bot_response = {
-                "role": "assistant",
-                "content": response,
-                "timestamp": datetime.now(),
-                "agent_status": agent_status,
-                "tool_info": tool_info,
-                "processing_steps": [
-                    "메시지 분석 완료",
-                    f"툴 {len(tool_info)}개 선택",
-                    f"툴 실행 완료 (성공: {len([t for t in tool_info if t['success']])}, 실패: {len([t for t in tool_info if not t['success']])})",
-                    "응답 생성 완료"
-                ]
-            }
-            st.session_state.messages.append(bot_response)
-            
-        # 진행 상황 표시 제거
-        progress_container.empty()
-        status_container.empty()
+        agent_status = snapshot["mcp_status"]
+        new_logs = snapshot["new_logs"]
+        
+        # 사용된 툴 정보 추출 (커서 이후 로그 = 이번 요청에서 사용된 툴)
+        # 툴마다 dict를 만들지 않고 필드별 병렬 리스트로 저장
+        tool_info = {"name": [], "type": [], "success": [], "exec_time": [], "reason": [], "error": []}
+        for log in new_logs:
+            tool_info["name"].append(log.tool_name)
+            tool_info["type"].append(log.tool_type)
+            tool_info["success"].append(log.success)
+            tool_info["exec_time"].append(log.execution_time)
+            tool_info["reason"].append('알 수 없음')
+            tool_info["error"].append(log.error)
+        
+        # 툴 실행 통계는 메시지 생성 시 한 번만 계산 (재실행마다 다시 집계하지 않음)
+        tool_stats = compute_tool_stats(tool_info)
+        
+        bot_response = {
+            "role": "assistant",
+            "content": response,
+            **_stamp(),
+            "agent_status": agent_status,
+            "tool_info": tool_info,
+            "tool_stats": tool_stats,
+            "processing_steps": [
+                "메시지 분석 완료",
+                f"툴 {tool_stats['n']}개 선택",
+                f"툴 실행 완료 (성공: {tool_stats['ok']}, 실패: {tool_stats['fail']})",
+                "응답 생성 완료"
+            ]
+        }
+        st.session_state.messages.append(bot_response)
             
     except TimeoutError:
             error_response = {
                 "role": "assistant",
                 "content": "응답 생성 시간이 초과되었습니다. 더 간단한 요청을 시도해보세요.",
-                "timestamp": datetime.now(),
+                **_stamp(),
                 "error_type": "timeout"
             }
             st.session_state.messages.append(error_response)
@@ -442,7 +502,7 @@ def handle_user_input(user_input: str):
             error_response = {
                 "role": "assistant",
                 "content": "메모리 부족으로 요청을 처리할 수 없습니다. 페이지를 새로고침하고 더 간단한 요청을 시도해주세요.",
-                "timestamp": datetime.now(),
+                **_stamp(),
                 "error_type": "memory"
             }
             st.session_state.messages.append(error_response)
@@ -451,14 +511,32 @@ def handle_user_input(user_input: str):
         error_response = {
             "role": "assistant",
             "content": generate_user_friendly_error_message(e, "processing"),
-            "timestamp": datetime.now(),
+            **_stamp(),
             "error_type": "processing"
         }
         st.session_state.messages.append(error_response)
     
-    # 진행 상황 표시 제거 (에러 발생 시에도)
-    progress_container.empty()
-    status_container.empty()
+    # 툴 실행으로 통계/상태가 바뀌었으므로 캐시 무효화
+    bump_stats_version()
+
+def compute_tool_stats(tool_info: Dict[str, List]) -> Dict:
+    """
+    메시지에 표시할 툴 실행 통계 계산
+    
+    Args:
+        tool_info: 이번 요청에서 사용된 툴 정보 (필드별 병렬 리스트)
+        
+    Returns:
+        Dict: 총 툴 수(n), 성공(ok), 실패(fail), 총 실행시간(total_time)
+    """
+    n = len(tool_info["name"])
+    ok = sum(tool_info["success"])
+    return {
+        "n": n,
+        "ok": ok,
+        "fail": n - ok,
+        "total_time": sum(tool_info["exec_time"])
+    }
 
 def generate_user_friendly_error_message(error: Exception, context: str) -> str:
     """
@@ -471,8 +549,16 @@ def generate_user_friendly_error_message(error: Exception, context: str) -> str:
     Returns:
         str: 사용자 친화적 에러 메시지
     """
-    error_type = type(error).__name__
+    return _msg_for(type(error).__name__, context) or f"오류가 발생했습니다: {str(error)}"
+
+def _msg_for(error_type: str, context: str) -> Optional[str]:
+    """
+    예외 타입 이름과 컨텍스트별 에러 메시지 (알 수 없는 컨텍스트면 None)
     
+    Args:
+        error_type: 예외 클래스 이름
+        context: 에러 발생 컨텍스트 ("initialization", "processing")
+    """
     if context == "initialization":
         if error_type == 'ConnectionError':
             return "서버 연결에 실패했습니다. 네트워크 연결을 확인해주세요."
@@ -495,7 +581,7 @@ def generate_user_friendly_error_message(error: Exception, context: str) -> str:
         else:
             return "일시적인 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
     
-    return f"오류가 발생했습니다: {str(error)}"
+    return None
 
 def run_async_function_with_timeout(coro, timeout: int = 60):
     """
@@ -511,56 +597,30 @@ def run_async_function_with_timeout(coro, timeout: int = 60):
     Raises:
         TimeoutError: 타임아웃 발생 시
     """
-    import asyncio
-    import concurrent.futures
-    import threading
-    
-    def run_in_thread():
-        new_loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(new_loop)
-        try:
-            return new_loop.run_until_complete(asyncio.wait_for(coro, timeout=timeout))
-        finally:
-            new_loop.close()
-    
+    future = _submit(asyncio.wait_for(coro, timeout=timeout))
     try:
-        # 기존 이벤트 루프가 있는지 확인
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # 이미 실행 중인 루프가 있으면 새 스레드에서 실행
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_in_thread)
-                return future.result(timeout=timeout + 5)  # 추가 여유시간
-        else:
-            return loop.run_until_complete(asyncio.wait_for(coro, timeout=timeout))
-    except RuntimeError:
-        # 이벤트 루프가 없으면 새로 생성
-        return asyncio.run(asyncio.wait_for(coro, timeout=timeout))
+        return future.result(timeout=timeout + 5)  # 추가 여유시간
+    except (asyncio.TimeoutError, concurrent.futures.TimeoutError):
+        # Python 3.10 이하에서는 두 예외가 내장 TimeoutError와 다른 클래스이므로 변환
+        future.cancel()
+        raise TimeoutError(f"{timeout}초 안에 처리가 완료되지 않았습니다")
 
 def display_message(message: Dict):
     """채팅 메시지를 표시하는 함수 (향상된 에러 표시)"""
     if message["role"] == "user":
         with st.chat_message("user"):
             st.write(message["content"])
-            st.caption(f"🕐 {message['timestamp'].strftime('%H:%M:%S')}")
+            st.caption(f"🕐 {message.get('ts_str') or message['timestamp'].strftime('%H:%M:%S')}")
     else:
         with st.chat_message("assistant"):
             # 에러 타입에 따른 아이콘 표시
-            error_type = message.get("error_type")
-            if error_type:
-                if error_type == "connection":
-                    st.error("🌐 연결 오류")
-                elif error_type == "timeout":
-                    st.warning("⏰ 시간 초과")
-                elif error_type == "memory":
-                    st.error("💾 메모리 부족")
-                elif error_type == "initialization":
-                    st.warning("🔧 초기화 오류")
-                elif error_type == "processing":
-                    st.warning("⚠️ 처리 오류")
+            badge = _ERR_BADGE.get(message.get("error_type"))
+            if badge:
+                show, label = badge
+                show(label)
             
             st.write(message["content"])
-            st.caption(f"🤖 {message['timestamp'].strftime('%H:%M:%S')}")
+            st.caption(f"🤖 {message.get('ts_str') or message['timestamp'].strftime('%H:%M:%S')}")
             
             # 에이전트 상태 정보 표시
             if "agent_status" in message:
@@ -579,84 +639,99 @@ def display_message(message: Dict):
                         st.write(f"{i}. {step}")
             
             # 툴 사용 정보 상세 표시
-            if "tool_info" in message and message["tool_info"]:
+            tool_info = message.get("tool_info")
+            if tool_info and tool_info["name"]:
                 with st.expander("🔧 사용된 툴 상세 정보", expanded=True):
-                    for i, tool in enumerate(message["tool_info"], 1):
+                    tool_count = len(tool_info["name"])
+                    for i, (name, tool_type, success, exec_time, reason, error) in enumerate(
+                        zip(tool_info["name"], tool_info["type"], tool_info["success"],
+                            tool_info["exec_time"], tool_info["reason"], tool_info["error"]), 1
+                    ):
                         col1, col2, col3 = st.columns([2, 1, 1])
                         
                         with col1:
-                            status_icon = "✅" if tool.get("success", True) else "❌"
-                            tool_type_icon = "🏠" if tool['type'] == 'local' else "🌐"
-                            st.write(f"{status_icon} {tool_type_icon} **{tool['name']}**")
-                            st.caption(f"선택 이유: {tool.get('reason', '알 수 없음')}")
+                            status_icon = "✅" if success else "❌"
+                            tool_type_icon = "🏠" if tool_type == 'local' else "🌐"
+                            st.write(f"{status_icon} {tool_type_icon} **{name}**")
+                            st.caption(f"선택 이유: {reason}")
                         
                         with col2:
-                            if 'execution_time' in tool:
-                                exec_time = tool['execution_time']
-                                if exec_time < 0.1:
-                                    time_color = "green"
-                                elif exec_time < 1.0:
-                                    time_color = "orange"
-                                else:
-                                    time_color = "red"
-                                st.markdown(f"⏱️ <span style='color:{time_color}'>{exec_time:.3f}초</span>", 
-                                          unsafe_allow_html=True)
+                            if exec_time < 0.1:
+                                time_color = "green"
+                            elif exec_time < 1.0:
+                                time_color = "orange"
+                            else:
+                                time_color = "red"
+                            st.markdown(f"⏱️ <span style='color:{time_color}'>{exec_time:.3f}초</span>", 
+                                      unsafe_allow_html=True)
                         
                         with col3:
-                            if tool.get("success", True):
+                            if success:
                                 st.success("성공")
                             else:
                                 st.error("실패")
                         
                         # 에러 정보 표시
-                        if not tool.get("success", True) and "error" in tool:
-                            st.error(f"🚨 오류: {tool['error']}")
+                        if not success and error is not None:
+                            st.error(f"🚨 오류: {error}")
                         
-                        if i < len(message["tool_info"]):
+                        if i < tool_count:
                             st.divider()
                 
-                # 툴 실행 통계 요약
-                successful_tools = [t for t in message["tool_info"] if t.get("success", True)]
-                failed_tools = [t for t in message["tool_info"] if not t.get("success", True)]
-                total_time = sum(t.get('execution_time', 0) for t in message["tool_info"])
+                # 툴 실행 통계 요약 (메시지 생성 시 계산해 둔 값 사용)
+                tool_stats = message.get("tool_stats") or compute_tool_stats(tool_info)
                 
                 col1, col2, col3, col4 = st.columns(4)
                 with col1:
-                    st.metric("총 툴 수", len(message["tool_info"]))
+                    st.metric("총 툴 수", tool_stats["n"])
                 with col2:
-                    st.metric("성공", len(successful_tools), delta=f"{len(successful_tools)}/{len(message['tool_info'])}")
+                    st.metric("성공", tool_stats["ok"], delta=f"{tool_stats['ok']}/{tool_stats['n']}")
                 with col3:
-                    st.metric("실패", len(failed_tools), delta=f"{len(failed_tools)}/{len(message['tool_info'])}")
+                    st.metric("실패", tool_stats["fail"], delta=f"{tool_stats['fail']}/{tool_stats['n']}")
                 with col4:
-                    st.metric("총 실행시간", f"{total_time:.3f}초")
+                    st.metric("총 실행시간", f"{tool_stats['total_time']:.3f}초")
             
-            # 사용자 피드백 수집
+            # 사용자 피드백 수집 (피드백 클릭은 이 영역만 다시 실행)
             if "feedback_collected" not in message:
-                st.markdown("---")
-                st.write("**이 응답이 도움이 되었나요?**")
-                
-                col1, col2, col3 = st.columns([1, 1, 2])
-                
-                with col1:
-                    if st.button("👍 도움됨", key=f"helpful_{message['timestamp']}", use_container_width=True):
-                        collect_feedback(message, "helpful", "사용자가 응답을 도움이 된다고 평가")
-                        st.success("피드백 감사합니다!")
-                        st.rerun()
-                
-                with col2:
-                    if st.button("👎 도움안됨", key=f"not_helpful_{message['timestamp']}", use_container_width=True):
-                        collect_feedback(message, "not_helpful", "사용자가 응답을 도움이 안된다고 평가")
-                        st.info("피드백 감사합니다. 더 나은 서비스를 위해 노력하겠습니다.")
-                        st.rerun()
-                
-                with col3:
-                    feedback_text = st.text_input("추가 의견 (선택사항)", 
-                                                key=f"feedback_text_{message['timestamp']}", 
-                                                placeholder="개선사항이나 의견을 알려주세요")
-                    if feedback_text and st.button("📝 의견 제출", key=f"submit_feedback_{message['timestamp']}"):
-                        collect_feedback(message, "comment", feedback_text)
-                        st.success("소중한 의견 감사합니다!")
-                        st.rerun()
+                render_feedback(message)
+
+@_fragment
+def render_feedback(message: Dict):
+    """응답 메시지 피드백 위젯 (의견 입력창은 📝를 눌렀을 때만 표시)"""
+    if "feedback_collected" in message:
+        return
+    
+    ts = message['timestamp']
+    fb_open_key = f"fb_open_{ts}"
+    
+    st.markdown("---")
+    st.write("**이 응답이 도움이 되었나요?**")
+    
+    # 클릭 콜백은 재실행 전에 실행되므로 별도의 st.rerun() 없이 제출 후 위젯이 사라짐
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        st.button("👍 도움됨", key=f"helpful_{ts}", use_container_width=True, on_click=collect_feedback,
+                  args=(message, "helpful", "사용자가 응답을 도움이 된다고 평가"))
+    with col2:
+        st.button("👎 도움안됨", key=f"not_helpful_{ts}", use_container_width=True, on_click=collect_feedback,
+                  args=(message, "not_helpful", "사용자가 응답을 도움이 안된다고 평가"))
+    with col3:
+        if st.button("📝", key=f"toggle_feedback_{ts}", help="추가 의견 남기기"):
+            st.session_state[fb_open_key] = not st.session_state.get(fb_open_key, False)
+        
+        # 의견 입력창은 📝로 연 메시지에만 표시
+        if st.session_state.get(fb_open_key, False):
+            feedback_text = st.text_input("추가 의견 (선택사항)", 
+                                        key=f"feedback_text_{ts}", 
+                                        placeholder="개선사항이나 의견을 알려주세요")
+            if feedback_text:
+                st.button("📝 의견 제출", key=f"submit_feedback_{ts}", on_click=_submit_comment,
+                          args=(message, ts))
+
+def _submit_comment(message: Dict, ts: datetime):
+    """추가 의견 제출 콜백 (입력창 수정과 클릭이 같은 재실행에 오므로 최신 값은 세션 상태에서 읽음)"""
+    collect_feedback(message, "comment", st.session_state.get(f"feedback_text_{ts}", ""))
+    st.session_state.pop(f"fb_open_{ts}", None)
 
 def collect_feedback(message: Dict, feedback_type: str, feedback_content: str):
     """
@@ -682,10 +757,11 @@ def collect_feedback(message: Dict, feedback_type: str, feedback_content: str):
             feedback_type=feedback_type,
             feedback_content=feedback_content,
             message_timestamp=message["timestamp"],
-            tool_count=len(message.get("tool_info", [])),
+            tool_count=len(message["tool_info"]["name"]) if "tool_info" in message else 0,
             response_length=len(message["content"])
         )
 
+@_fragment
 def show_agent_status():
     """에이전트 상태를 표시하는 함수 (향상된 에러 표시)"""
     if not st.session_state.agent_initialized:
@@ -701,7 +777,11 @@ def show_agent_status():
                 st.metric("로컬 툴", f"{local_count}개", delta="사용 가능")
         with col3:
             if st.session_state.agent_manager:
-                mcp_status_info = st.session_state.agent_manager.get_mcp_status()
+                mcp_status_info = _cached_mcp_status(
+                    st.session_state.agent_manager,
+                    st.session_state.session_id,
+                    st.session_state.stats_version
+                )
                 if mcp_status_info["connected"]:
                     st.metric("MCP 서버", "연결됨", delta="정상")
                 else:
@@ -709,7 +789,11 @@ def show_agent_status():
         
         # 에러 상태 상세 표시
         if st.session_state.agent_manager:
-            mcp_status = st.session_state.agent_manager.get_mcp_status()
+            mcp_status = _cached_mcp_status(
+                st.session_state.agent_manager,
+                st.session_state.session_id,
+                st.session_state.stats_version
+            )
             
             if not mcp_status["connected"] and mcp_status["connection_error"]:
                 with st.expander("⚠️ MCP 서버 연결 문제", expanded=False):
@@ -733,6 +817,7 @@ def show_agent_status():
                     if st.button("🔄 MCP 서버 재연결 시도"):
                         with st.spinner("재연결 시도 중..."):
                             success = run_async_function(st.session_state.agent_manager.reconnect_mcp())
+                            bump_stats_version()
                             if success:
                                 st.success("재연결 성공!")
                                 st.rerun()
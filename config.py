@@ -1,9 +1,9 @@
 # 설정 파일
 # AWS Cloud9에서 쉽게 복사할 수 있도록 일반 파일로 생성
 
-# Smithery MCP 설정
-SMITHERY_API_KEY = "20f09ddc-b65d-448c-9c3b-4199c5cc7892"
-SMITHERY_PROFILE = "profitable-cicada-SuKab9"
+import functools
+import os
+from typing import Optional, Tuple
 
 # 로깅 레벨
 LOG_LEVEL = "INFO"
@@ -16,4 +16,18 @@ STREAMLIT_SERVER_ADDRESS = "0.0.0.0"
 MCP_CONNECTION_TIMEOUT = 30
 
 # 툴 실행 타임아웃 (초)
-TOOL_EXECUTION_TIMEOUT = 10
\ No newline at end of file
+TOOL_EXECUTION_TIMEOUT = 10
+
+
+# Smithery MCP 설정 (API 키는 코드에 두지 않고 환경변수 SMITHERY_API_KEY/SMITHERY_PROFILE에서 읽음)
+@functools.lru_cache(maxsize=1)
+def smithery_credentials() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Smithery API 키와 프로필 반환 (최초 호출 시 한 번만 환경변수 조회)
+    
+    .env는 호출 시점에 이미 로드되어 있어야 하므로 모듈 임포트 시점이 아닌 첫 호출 때 읽습니다.
+    
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (API 키, 프로필), 설정되지 않은 값은 None
+    """
+    return os.environ.get("SMITHERY_API_KEY"), os.environ.get("SMITHERY_PROFILE")
@@ -0,0 +1,76 @@
+"""
+공유 HTTP 클라이언트
+Smithery MCP 연결 시도와 재연결이 하나의 커넥션 풀(keep-alive)을 재사용하도록 관리합니다.
+"""
+
+from typing import Optional
+
+import httpx
+
+# HTTP/2 지원 여부 확인 (h2 패키지가 필요)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class _SharedAsyncClient(httpx.AsyncClient):
+    """
+    여러 MCP 연결이 공유하는 httpx 클라이언트
+
+    streamablehttp_client는 전달받은 클라이언트를 async with로 감싸 종료 시 닫으므로,
+    컨텍스트 진입/종료를 무시하고 close_http_client()에서만 실제로 닫습니다.
+    """
+
+    async def __aenter__(self) -> "_SharedAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+_http_client: Optional[_SharedAsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    공유 httpx.AsyncClient 반환 (없거나 닫혀 있으면 새로 생성)
+
+    Returns:
+        httpx.AsyncClient: 커넥션 풀이 설정된 공유 클라이언트
+    """
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _SharedAsyncClient(
+            # SSE 스트림은 서버가 오래 열어둘 수 있으므로 읽기 타임아웃은 MCP 기본값(5분) 유지
+            timeout=httpx.Timeout(30.0, read=300.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300
+            ),
+            http2=HTTP2_AVAILABLE
+        )
+
+    return _http_client
+
+
+def mcp_http_client_factory(headers=None, timeout=None, auth=None) -> httpx.AsyncClient:
+    """
+    streamablehttp_client의 httpx_client_factory로 사용하는 팩토리
+
+    MCP 전송 계층이 전달하는 headers/timeout/auth 대신 공유 클라이언트 설정을 사용합니다.
+    """
+    return get_http_client()
+
+
+async def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료"""
+    global _http_client
+
+    if _http_client is not None:
+        client = _http_client
+        _http_client = None
+        await client.aclose()
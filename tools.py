@@ -3,33 +3,184 @@
 간단한 데코레이터를 사용하여 툴을 정의합니다.
 """
 
-from datetime import datetime
-from typing import Union, Dict, Any, List
+import functools
+import inspect
+import json
+import math
+import operator
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Callable, NamedTuple, Optional, Tuple, Union, Dict, Any
 
+# 툴 스키마 JSON 직렬화 (orjson이 없으면 표준 json 모듈 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def strands_tool(name: str, description: str):
-    """Strands Agent의 툴로 함수를 등록하는 데코레이터"""
+# Numba 지원 여부 확인 (numba 패키지가 필요)
+try:
+    from numba import cfunc, njit, vectorize, int64, float64
+    import numpy as np
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 산술 툴 JIT 컴파일 사용 여부 (numba가 설치되어 있고 STRANDS_NUMBA_TOOLS=1일 때만)
+# int64 범위를 넘는 정수는 처리하지 못하므로 기본값은 순수 Python 함수 사용
+_USE_NUMBA = NUMBA_AVAILABLE and os.getenv("STRANDS_NUMBA_TOOLS") == "1"
+
+if _USE_NUMBA:
+    # 정수 입력은 정수로, 그 외에는 실수로 계산 (나눗셈은 항상 실수 결과)
+    _INT_FLOAT_SIGS = [int64(int64, int64), float64(float64, float64)]
+    _FLOAT_SIGS = [float64(float64, float64)]
+else:
+    _INT_FLOAT_SIGS = _FLOAT_SIGS = None
+
+
+def _jit_numeric(signatures):
+    """
+    산술 툴을 지정한 시그니처로 JIT 컴파일하는 데코레이터 (디스크 캐시 사용)
+    
+    Numba를 사용하지 않으면 원래 함수를 그대로 반환합니다.
+    strands_tool은 이 데코레이터 바깥에 적용하여 컴파일된 함수에 메타데이터를 붙입니다.
+    """
     def decorator(func):
-        # 함수에 툴 관련 메타데이터를 추가
-        func.tool_name = name
-        func.tool_description = description
-        return func
+        if not _USE_NUMBA:
+            return func
+        return njit(signatures, cache=True)(func)
     return decorator
 
 
+class ToolSpec(NamedTuple):
+    """등록된 툴 메타데이터"""
+    function: Callable[..., Any]
+    name: str
+    description: str
+
+
+# 데코레이터로 등록된 툴 (툴 이름 -> ToolSpec), 정의 순서 유지
+_TOOL_REGISTRY: Dict[str, ToolSpec] = {}
+
+# 위치 인자 호출용 툴 매개변수 이름 (툴 이름 -> 매개변수 이름 튜플)
+# 위치/키워드 겸용 매개변수만 있는 툴만 포함하며, 나머지는 키워드 인자로 호출하는 디스패처 생성
+_TOOL_SIG: Dict[str, Tuple[str, ...]] = {}
+
+# 툴별 전용 디스패처 (툴 이름 -> 인자 dict를 받아 툴을 호출하는 생성 함수)
+_DISPATCHERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+
+# execute_tool에서 누락된 인자를 구분하기 위한 표식
+_MISSING = object()
+
+# 툴 이름 목록 캐시 (툴 등록 시 무효화)
+_TOOL_NAMES_CACHE: Optional[Tuple[str, ...]] = None
+
+# 툴 스키마 JSON 캐시 (툴 등록 시 무효화)
+_TOOL_SCHEMA_JSON: Optional[bytes] = None
+
+
+def _build_dispatcher(func: Callable[..., Any], argnames: Optional[Tuple[str, ...]],
+                      positional_impl: Optional[Callable[..., Any]] = None) -> Callable[[Dict[str, Any]], Any]:
+    """
+    툴 전용 디스패처 생성 (인자 dict에서 매개변수를 꺼내 위치 인자로 호출하는 코드를 exec로 컴파일)
+    
+    인자 개수나 이름이 시그니처와 맞지 않으면 키워드 인자로 호출해 원래의 TypeError가 나도록 합니다.
+    위치 인자로 호출할 수 없는 시그니처(argnames가 None)는 항상 키워드 인자로 호출합니다.
+    positional_impl이 주어지면 위치 인자 호출에는 툴 함수 대신 이를 사용합니다.
+    """
+    if argnames is None:
+        src = "def _dispatch(kw):\n    return _f(**kw)\n"
+    elif not argnames:
+        src = (
+            "def _dispatch(kw):\n"
+            "    if kw:\n"
+            "        return _f(**kw)\n"
+            "    return _f()\n"
+        )
+    else:
+        locals_ = [f"_a{i}" for i in range(len(argnames))]
+        unpack = "; ".join(f"{var} = kw[{arg!r}]" for var, arg in zip(locals_, argnames))
+        src = (
+            "def _dispatch(kw):\n"
+            f"    if len(kw) != {len(argnames)}:\n"
+            "        return _f(**kw)\n"
+            "    try:\n"
+            f"        {unpack}\n"
+            "    except KeyError:\n"
+            "        return _f(**kw)\n"
+            f"    return _p({', '.join(locals_)})\n"
+        )
+    
+    namespace = {"_f": func, "_p": positional_impl or func}
+    exec(compile(src, f"<dispatch {func.__name__}>", "exec"), namespace)
+    return namespace["_dispatch"]
+
+
+def _register_tool(func, name: str, description: str, positional_impl: Optional[Callable[..., Any]] = None):
+    """
+    툴 함수에 메타데이터를 붙이고 레지스트리에 등록
+    
+    positional_impl: execute_tool의 위치 인자 호출에 쓸 동일 동작의 C 구현 (예: operator.add)
+    """
+    global _TOOL_NAMES_CACHE, _TOOL_SCHEMA_JSON
+    
+    # 함수에 툴 관련 메타데이터를 추가
+    func.tool_name = name
+    func.tool_description = description
+    
+    # 호출할 때마다 모듈을 다시 검사하지 않도록 정의 시점에 등록
+    _TOOL_REGISTRY[name] = ToolSpec(func, name, description)
+    
+    params = inspect.signature(func).parameters.values()
+    if all(p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for p in params):
+        _TOOL_SIG[name] = tuple(p.name for p in params)
+    else:
+        _TOOL_SIG.pop(name, None)
+    _DISPATCHERS[name] = _build_dispatcher(func, _TOOL_SIG.get(name), positional_impl)
+    
+    _TOOL_NAMES_CACHE = None
+    _TOOL_SCHEMA_JSON = None
+    return func
+
+
+def strands_tool(name: str, description: str, positional_impl: Optional[Callable[..., Any]] = None):
+    """
+    Strands Agent의 툴로 함수를 등록하는 데코레이터
+    
+    operator.add 같은 내장 함수는 속성을 붙일 수 없고 키워드 인자도 받지 않으므로,
+    툴 자체는 일반 함수로 정의하고 positional_impl로 execute_tool의 빠른 경로에만 사용합니다.
+    """
+    # 중첩 클로저 대신 이름/설명을 고정한 partial 반환
+    return functools.partial(_register_tool, name=name, description=description,
+                             positional_impl=positional_impl)
+
+
+# current_date 캐시: [만료 시각(에포크 초, 다음 자정), 날짜 문자열]
+_DATE_CACHE = [0.0, ""]
+
+
 @strands_tool(
     name="current_date", 
     description="현재 날짜를 YYYY-MM-DD 형식으로 반환합니다. 오늘 날짜나 현재 날짜를 묻는 질문에 사용하세요."
 )
 def current_date() -> str:
     """현재 날짜를 반환합니다."""
-    return datetime.now().strftime("%Y-%m-%d")
+    # 같은 날에는 캐시된 문자열을 반환하고, 자정이 지나면 다시 계산
+    if time.time() >= _DATE_CACHE[0]:
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        _DATE_CACHE[1] = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+        _DATE_CACHE[0] = next_midnight.timestamp()  # 로컬 시간 기준 (서머타임 반영)
+    return _DATE_CACHE[1]
 
 
 @strands_tool(
     name="add", 
-    description="두 숫자를 더합니다. 덧셈, 합계, 플러스 연산에 사용하세요."
+    description="두 숫자를 더합니다. 덧셈, 합계, 플러스 연산에 사용하세요.",
+    positional_impl=operator.add
 )
+@_jit_numeric(_INT_FLOAT_SIGS)
 def add(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     """두 수를 더합니다."""
     return a + b
@@ -37,8 +188,10 @@ def add(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
 
 @strands_tool(
     name="subtract", 
-    description="첫 번째 숫자에서 두 번째 숫자를 뺍니다. 뺄셈, 차이, 마이너스 연산에 사용하세요."
+    description="첫 번째 숫자에서 두 번째 숫자를 뺍니다. 뺄셈, 차이, 마이너스 연산에 사용하세요.",
+    positional_impl=operator.sub
 )
+@_jit_numeric(_INT_FLOAT_SIGS)
 def subtract(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     """두 수를 뺍니다."""
     return a - b
@@ -46,55 +199,172 @@ def subtract(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
 
 @strands_tool(
     name="multiply", 
-    description="두 숫자를 곱합니다. 곱셈, 곱하기, 배수 연산에 사용하세요."
+    description="두 숫자를 곱합니다. 곱셈, 곱하기, 배수 연산에 사용하세요.",
+    positional_impl=operator.mul
 )
+@_jit_numeric(_INT_FLOAT_SIGS)
 def multiply(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     """두 수를 곱합니다."""
     return a * b
 
 
+# 0으로 나눌 때의 예외 메시지 (실패 경로에서만 예외 객체 생성)
+_ZERO_DIVISION_MSG = "0으로 나눌 수 없습니다"
+
+
+def _divide_fast(a: Union[int, float], b: Union[int, float]) -> float:
+    """0 검사 없이 나눕니다 (Numba 사용 시 0으로 나누면 IEEE-754 규칙대로 inf/nan 반환)"""
+    return a / b
+
+
+if _USE_NUMBA:
+    # error_model="numpy": 0으로 나눠도 예외 없이 inf/nan을 반환해 분기 없는 코드로 컴파일
+    _divide_fast = njit(_FLOAT_SIGS, cache=True, error_model="numpy")(_divide_fast)
+
+
 @strands_tool(
     name="divide", 
     description="첫 번째 숫자를 두 번째 숫자로 나눕니다. 나눗셈, 나누기, 몫 연산에 사용하세요."
 )
 def divide(a: Union[int, float], b: Union[int, float]) -> Union[int, float]:
     """두 수를 나눕니다."""
-    if b == 0:
-        raise ZeroDivisionError("0으로 나눌 수 없습니다")
-    return a / b
+    # 성공 경로에서는 0 검사 없이 나누고, 0으로 나눈 경우만 사후에 판별
+    try:
+        result = _divide_fast(a, b)
+    except ZeroDivisionError:
+        raise ZeroDivisionError(_ZERO_DIVISION_MSG) from None
+    
+    # Numba 경로는 예외 대신 inf/nan을 반환하므로 결과가 유한하지 않을 때만 0 여부 확인
+    if _USE_NUMBA and not math.isfinite(result) and b == 0:
+        raise ZeroDivisionError(_ZERO_DIVISION_MSG)
+    return result
+
+
+# 실수 산술용 C 함수 (Numba 사용 시에만, 툴 이름 -> numba cfunc)
+# njit 디스패처의 Python 래퍼(인자 박싱/타입 디스패치)를 거치지 않고 C 함수 포인터로 직접 호출
+_C_FUNCS: Dict[str, Any] = {}
+
+if _USE_NUMBA:
+    _C_SIG = "float64(float64, float64)"
+    _C_FUNCS["add"] = cfunc(_C_SIG, cache=True)(lambda a, b: a + b)
+    _C_FUNCS["subtract"] = cfunc(_C_SIG, cache=True)(lambda a, b: a - b)
+    _C_FUNCS["multiply"] = cfunc(_C_SIG, cache=True)(lambda a, b: a * b)
+    _C_FUNCS["divide"] = cfunc(_C_SIG, cache=True, error_model="numpy")(lambda a, b: a / b)
+
+# execute_tool에서 사용할 ctypes 호출 객체 (툴 이름 -> ctypes 함수)
+_C_ARITH: Dict[str, Callable[[float, float], float]] = {name: cf.ctypes for name, cf in _C_FUNCS.items()}
+
+# 배열 입력용 산술 ufunc (Numba 사용 시에만, 툴 이름 -> 요소별 병렬 ufunc)
+# NumPy 배열을 받으면 요소마다 툴을 호출하지 않고 한 번의 호출로 전체를 계산
+_V_ARITH: Dict[str, Callable[[Any, Any], Any]] = {}
+
+if _USE_NUMBA:
+    _V_ARITH["add"] = vectorize(_INT_FLOAT_SIGS, target="parallel", cache=True)(lambda a, b: a + b)
+    _V_ARITH["subtract"] = vectorize(_INT_FLOAT_SIGS, target="parallel", cache=True)(lambda a, b: a - b)
+    _V_ARITH["multiply"] = vectorize(_INT_FLOAT_SIGS, target="parallel", cache=True)(lambda a, b: a * b)
+    _V_ARITH["divide"] = vectorize(_FLOAT_SIGS, target="parallel", cache=True)(lambda a, b: a / b)
+
+# C 함수 경로로 보낼 수 있는 인자 타입 (bool 등 하위 타입은 일반 툴로 처리)
+_C_ARG_TYPES = (int, float)
 
 
 # 툴 수집 및 관리 함수들
-def get_all_tools() -> Dict[str, Any]:
-    """데코레이터로 등록된 모든 툴을 수집"""
-    tools = {}
+def get_all_tools() -> Dict[str, ToolSpec]:
+    """
+    데코레이터로 등록된 모든 툴 반환
+    
+    등록 시점에 채워진 레지스트리를 그대로 반환하므로 호출자는 수정하지 말아야 합니다.
+    """
+    return _TOOL_REGISTRY
+
+
+def get_available_tools() -> Tuple[str, ...]:
+    """사용 가능한 툴 이름 목록 반환 (최초 호출 시 한 번만 생성한 튜플)"""
+    global _TOOL_NAMES_CACHE
     
-    # 현재 모듈의 모든 함수를 검사
-    import sys
-    current_module = sys.modules[__name__]
+    if _TOOL_NAMES_CACHE is None:
+        _TOOL_NAMES_CACHE = tuple(_TOOL_REGISTRY)
+    return _TOOL_NAMES_CACHE
+
+
+def get_tools_schema_json() -> bytes:
+    """
+    툴 이름/설명 목록을 UTF-8 JSON 바이트로 반환 (최초 호출 시 한 번만 직렬화)
     
-    for name in dir(current_module):
-        obj = getattr(current_module, name)
-        if callable(obj) and hasattr(obj, 'tool_name'):
-            tools[obj.tool_name] = {
-                'function': obj,
-                'name': obj.tool_name,
-                'description': obj.tool_description
-            }
+    Returns:
+        bytes: [{"name": ..., "description": ...}, ...] 형태의 JSON
+    """
+    global _TOOL_SCHEMA_JSON
     
-    return tools
+    if _TOOL_SCHEMA_JSON is None:
+        schema = [{"name": spec.name, "description": spec.description} for spec in _TOOL_REGISTRY.values()]
+        if orjson is not None:
+            _TOOL_SCHEMA_JSON = orjson.dumps(schema)
+        else:
+            _TOOL_SCHEMA_JSON = json.dumps(schema, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _TOOL_SCHEMA_JSON
 
 
-def get_available_tools() -> List[str]:
-    """사용 가능한 툴 이름 목록 반환"""
-    return list(get_all_tools().keys())
+def get_all_tools_native() -> Dict[str, int]:
+    """
+    산술 툴의 C 함수 주소 반환 (네이티브 호출자가 인터프리터를 거치지 않고 직접 호출하는 용도)
+    
+    각 주소는 C 시그니처 double (*)(double, double) 함수 포인터이며, divide는 0으로 나누면
+    예외 대신 IEEE-754 규칙대로 inf/nan을 반환합니다. Numba를 사용하지 않으면 빈 dict를 반환합니다.
+    
+    Returns:
+        Dict[str, int]: 툴 이름 -> 함수 주소 (uintptr_t)
+    """
+    return {name: cf.address for name, cf in _C_FUNCS.items()}
 
 
 def execute_tool(name: str, **kwargs) -> Any:
     """툴 실행"""
-    tools = get_all_tools()
-    if name not in tools:
-        raise ValueError(f"Unknown tool: {name}")
+    try:
+        dispatch = _DISPATCHERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown tool: {name}") from None
     
-    tool_func = tools[name]['function']
-    return tool_func(**kwargs)
\ No newline at end of file
+    # Numba 산술 경로 (STRANDS_NUMBA_TOOLS=1일 때만 등록됨)
+    if name in _C_ARITH and len(kwargs) == 2:
+        a = kwargs.get("a", _MISSING)
+        b = kwargs.get("b", _MISSING)
+        if a is not _MISSING and b is not _MISSING:
+            # NumPy 배열 인자는 요소별 ufunc로 한 번에 계산
+            if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+                if name == "divide" and np.any(np.asarray(b) == 0):
+                    raise ZeroDivisionError(_ZERO_DIVISION_MSG)
+                return _V_ARITH[name](a, b)
+            
+            # 실수 인자가 있는 산술 연산은 C 함수로 계산
+            # (정수끼리의 연산은 정수 결과를 유지하고, 0으로 나누기는 예외를 내도록 일반 툴 사용)
+            if (type(a) in _C_ARG_TYPES and type(b) in _C_ARG_TYPES
+                    and (type(a) is float or type(b) is float) and not (name == "divide" and b == 0)):
+                return _C_ARITH[name](float(a), float(b))
+    
+    # 툴별로 생성해 둔 디스패처가 인자를 위치 인자로 풀어 호출
+    return dispatch(kwargs)
+
+
+def _warmup_jit() -> None:
+    """
+    JIT 컴파일된 산술 툴을 미리 한 번씩 호출
+    
+    명시한 시그니처는 데코레이터 적용 시 컴파일되지만, 디스패처의 첫 호출 시 타입 결정과
+    디스크 캐시 로드가 일어나므로 이를 첫 사용자 요청 전에 끝내 둡니다.
+    """
+    # 에이전트는 툴 함수를 직접 호출하므로 execute_tool의 빠른 경로(operator/cfunc)가 아닌
+    # JIT 디스패처를 정수/실수 인자로 각각 호출
+    for tool in (add, subtract, multiply, divide):
+        tool(1, 1)
+        tool(1.0, 1.0)
+    
+    if _V_ARITH:
+        sample = np.ones(2)
+        for v_func in _V_ARITH.values():
+            v_func(sample, sample)
+
+
+# 임포트 시 JIT 워밍업 (Numba 사용 중이고 STRANDS_WARMUP_JIT=1일 때만)
+if _USE_NUMBA and os.getenv("STRANDS_WARMUP_JIT") == "1":
+    _warmup_jit()